@@ -0,0 +1,4 @@
+# Entry point for running the tracker as a package: python -m binance_tracker
+from binance_tracker.main import main
+
+main()
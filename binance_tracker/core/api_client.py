@@ -8,6 +8,33 @@ from datetime import datetime, timedelta
 import random
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
+import importlib.util
+import sys
+
+# Get the absolute path of the current script
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Import modules directly using file paths (each file is loaded once and shared)
+def import_from_file(module_name, file_path):
+    key = f"binance_tracker:{os.path.normcase(os.path.abspath(file_path))}"
+    module = sys.modules.get(key)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[key] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[key]
+            raise
+    return module
+
+# Import required modules
+core_calculator = import_from_file("calculator", os.path.join(current_dir, "calculator.py"))
+
+# Get required classes
+Position = core_calculator.Position
+split_symbol = core_calculator.split_symbol
 
 # Try different import paths for BinanceSocketManager based on package version
 try:
@@ -831,7 +858,7 @@ class BinanceApiClient:
             }
     
     def calculate_position_metrics(self, symbol: str, include_orders: Optional[List[int]] = None,
-                                  manual_price: Optional[float] = None, manual_orders: Optional[List[Dict]] = None) -> Dict:
+                                  manual_price: Optional[float] = None, manual_orders: Optional[List[Dict]] = None) -> Position:
         """
         Calculate position metrics including average buy price, break-even, and PnL.
         
@@ -842,7 +869,7 @@ class BinanceApiClient:
             manual_orders: Optional list of manually added orders (for symbols not available via API)
             
         Returns:
-            Dictionary with position metrics
+            Position with metrics
         """
         try:
             # Initialize variables
@@ -947,40 +974,25 @@ class BinanceApiClient:
             # Calculate available and locked amounts
             available_qty = total_qty - locked_qty
             
-            return {
-                'symbol': symbol,
-                'current_price': current_price,
-                'holdings': total_qty,
-                'available': available_qty,
-                'locked': locked_qty,
-                'open_orders': open_orders,
-                'avg_buy_price': avg_buy_price,
-                'break_even_price': break_even_price,
-                'total_cost': total_cost,
-                'current_value': current_value,
-                'pnl_amount': pnl_amount,
-                'pnl_percent': pnl_percent,
-                'is_manual': is_manual or manual_price is not None or manual_orders is not None,
-                'mapped_symbol': self.get_mapped_symbol(symbol) if self.get_mapped_symbol(symbol) != symbol else None
-            }
+            return Position(
+                symbol=symbol,
+                current_price=current_price,
+                holdings=total_qty,
+                available=available_qty,
+                locked=locked_qty,
+                open_orders=open_orders,
+                avg_buy_price=avg_buy_price,
+                break_even_price=break_even_price,
+                total_cost=total_cost,
+                current_value=current_value,
+                pnl_amount=pnl_amount,
+                pnl_percent=pnl_percent,
+                is_manual=is_manual or manual_price is not None or manual_orders is not None,
+                mapped_symbol=self.get_mapped_symbol(symbol) if self.get_mapped_symbol(symbol) != symbol else None
+            )
         except Exception as e:
             print(f"Error calculating position metrics: {e}")
-            return {
-                'symbol': symbol,
-                'current_price': 0,
-                'holdings': 0,
-                'available': 0,
-                'locked': 0,
-                'open_orders': [],
-                'avg_buy_price': 0,
-                'break_even_price': 0,
-                'total_cost': 0,
-                'current_value': 0,
-                'pnl_amount': 0,
-                'pnl_percent': 0,
-                'is_manual': False,
-                'error': str(e)
-            }
+            return Position(symbol=symbol, error=str(e))
     
     def start_symbol_ticker_websocket(self, symbol: str, callback: Callable[[Dict], Any]) -> str:
         """
@@ -1432,8 +1444,7 @@ class BinanceApiClient:
             # Extract asset from pair if not provided
             if not asset:
                 # Try to extract from pair
-                base_asset = pair[-4:] if pair[-4:] in ['USDT', 'USDC', 'BUSD', 'USDK'] else pair[-3:]
-                asset = pair[:-len(base_asset)]
+                asset, _ = split_symbol(pair)
             
             # Store preference
             if 'preferred_pairs' not in self.preferences:
@@ -1,4 +1,59 @@
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class Position:
+    """
+    Position metrics for a single trading pair.
+    
+    Supports dictionary-style access (``position['total_cost']``,
+    ``position.get('holdings', 0)``) for code written against the
+    previous dict-based metrics.
+    """
+    
+    symbol: str
+    current_price: float = 0.0
+    holdings: float = 0.0
+    available: float = 0.0
+    locked: float = 0.0
+    open_orders: List[Dict] = field(default_factory=list)
+    avg_buy_price: float = 0.0
+    break_even_price: float = 0.0
+    total_cost: float = 0.0
+    current_value: float = 0.0
+    pnl_amount: float = 0.0
+    pnl_percent: float = 0.0
+    is_manual: bool = False
+    mapped_symbol: Optional[str] = None
+    error: Optional[str] = None
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        setattr(self, key, value)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a metric by name.
+        
+        Args:
+            key: Metric name
+            default: Value returned if the metric does not exist
+            
+        Returns:
+            Metric value or default
+        """
+        return getattr(self, key, default)
+
 
 
 def calculate_average_buy_price(orders: List[Dict]) -> float:
@@ -114,6 +169,29 @@ def calculate_portfolio_summary(positions: List[Dict]) -> Dict:
     }
 
 
+# Stablecoin suffixes recognised when splitting a trading pair symbol
+_QUOTES = ('USDT', 'USDC', 'BUSD', 'USDK', 'TUSD', 'FDUSD')
+
+
+@lru_cache(maxsize=1024)
+def split_symbol(symbol: str) -> Tuple[str, str]:
+    """
+    Split a trading pair symbol into asset and stablecoin/quote suffix.
+    
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTCUSDT')
+        
+    Returns:
+        Tuple of (asset, suffix), e.g. ('BTC', 'USDT'); falls back to a
+        3-letter suffix (e.g. 'ETHBTC' -> ('ETH', 'BTC'))
+    """
+    if symbol.endswith(_QUOTES):
+        for quote in _QUOTES:
+            if symbol.endswith(quote):
+                return symbol[:-len(quote)], quote
+    return symbol[:-3], symbol[-3:]
+
+
 def format_currency(value: float, precision: int = 8) -> str:
     """
     Format a value as a currency string.
@@ -125,6 +203,16 @@ def format_currency(value: float, precision: int = 8) -> str:
     Returns:
         Formatted currency string
     """
+    # Quantize to display precision so repeated prices share a cache entry
+    # (adding 0.0 turns -0.0 into 0.0, which the cache treats as equal)
+    if abs(value) >= 0.00000001:
+        value = round(value, precision)
+    return _format_currency(value + 0.0, precision)
+
+
+@lru_cache(maxsize=4096)
+def _format_currency(value: float, precision: int) -> str:
+    """Format a currency value (cached, see format_currency)."""
     # For very small values, use scientific notation
     if abs(value) < 0.00000001 and value != 0:
         return f"${value:.8e}"
@@ -144,6 +232,16 @@ def format_crypto_amount(value: float, precision: int = 8) -> str:
     Returns:
         Formatted crypto amount string
     """
+    # Quantize to display precision so repeated amounts share a cache entry
+    # (adding 0.0 turns -0.0 into 0.0, which the cache treats as equal)
+    if abs(value) >= 0.00000001:
+        value = round(value, 8)
+    return _format_crypto_amount(value + 0.0)
+
+
+@lru_cache(maxsize=4096)
+def _format_crypto_amount(value: float) -> str:
+    """Format a crypto amount (cached, see format_crypto_amount)."""
     # Always use 8 decimal places for consistency
     if value == 0:
         return "0.00000000"
@@ -164,5 +262,12 @@ def format_percent(value: float, precision: int = 4) -> str:
     Returns:
         Formatted percentage string
     """
+    # Adding 0.0 turns -0.0 into 0.0, which the cache treats as equal
+    return _format_percent(value + 0.0, precision)
+
+
+@lru_cache(maxsize=4096)
+def _format_percent(value: float, precision: int) -> str:
+    """Format a percentage (cached, see format_percent)."""
     sign = "+" if value >= 0 else ""
     return f"{sign}{value:.{precision}f}%"
\ No newline at end of file
@@ -8,11 +8,19 @@ from typing import Optional
 # Get the absolute path of the current script
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
-# Import modules directly using file paths
+# Import modules directly using file paths (each file is loaded once and shared)
 def import_from_file(module_name, file_path):
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    key = f"binance_tracker:{os.path.normcase(os.path.abspath(file_path))}"
+    module = sys.modules.get(key)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[key] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[key]
+            raise
     return module
 
 # Import required modules
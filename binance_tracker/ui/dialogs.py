@@ -1,5 +1,6 @@
 import os
 import importlib.util
+import sys
 import customtkinter as ctk
 from typing import Optional, Dict, List, Callable
 import json
@@ -9,18 +10,29 @@ import threading
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
 
-# Import modules directly using file paths
+# Import modules directly using file paths (each file is loaded once and shared)
 def import_from_file(module_name, file_path):
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    key = f"binance_tracker:{os.path.normcase(os.path.abspath(file_path))}"
+    module = sys.modules.get(key)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[key] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[key]
+            raise
     return module
 
 # Import required modules
 core_auth = import_from_file("auth", os.path.join(project_root, "core", "auth.py"))
+ui_utils = import_from_file("ui_utils", os.path.join(current_dir, "ui_utils.py"))
 
 # Get required functions
 encrypt_credentials = core_auth.encrypt_credentials
+center_on_parent = ui_utils.center_on_parent
+get_font = ui_utils.get_font
 
 
 class PinDialog(ctk.CTkToplevel):
@@ -39,7 +51,7 @@ class PinDialog(ctk.CTkToplevel):
         
         # Set dialog properties
         self.title("Enter PIN")
-        self.geometry("300x200")
+        center_on_parent(self, parent, 300, 200)
         self.resizable(False, False)
         
         # Make dialog modal
@@ -52,14 +64,6 @@ class PinDialog(ctk.CTkToplevel):
         # Create widgets
         self._create_widgets()
         
-        # Center dialog
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = parent.winfo_rootx() + (parent.winfo_width() // 2) - (width // 2)
-        y = parent.winfo_rooty() + (parent.winfo_height() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
-        
         # Set focus to PIN entry
         self.pin_entry.focus_set()
     
@@ -73,7 +77,7 @@ class PinDialog(ctk.CTkToplevel):
         label = ctk.CTkLabel(
             main_frame,
             text="Enter your 4-digit PIN",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         label.pack(pady=(0, 20))
         
@@ -140,7 +144,7 @@ class SetupDialog(ctk.CTkToplevel):
         
         # Set dialog properties
         self.title("Setup Binance API")
-        self.geometry("400x400")
+        center_on_parent(self, parent, 400, 400)
         self.resizable(False, False)
         
         # Make dialog modal
@@ -155,14 +159,6 @@ class SetupDialog(ctk.CTkToplevel):
         # Create widgets
         self._create_widgets()
         
-        # Center dialog
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = parent.winfo_rootx() + (parent.winfo_width() // 2) - (width // 2)
-        y = parent.winfo_rooty() + (parent.winfo_height() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
-        
         # Set focus to API key entry
         self.api_key_entry.focus_set()
     
@@ -176,7 +172,7 @@ class SetupDialog(ctk.CTkToplevel):
         title_label = ctk.CTkLabel(
             main_frame,
             text="Binance API Setup",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -185,7 +181,7 @@ class SetupDialog(ctk.CTkToplevel):
             main_frame,
             text="Please enter your Binance API credentials.\n"
                  "For security, use READ-ONLY API keys only.",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             justify="left"
         )
         info_label.pack(pady=(0, 20), fill="x")
@@ -298,7 +294,7 @@ class PairSelectionDialog(ctk.CTkToplevel):
         
         # Set dialog properties
         self.title("Select Trading Pairs")
-        self.geometry("600x500")
+        center_on_parent(self, parent, 600, 500)
         self.resizable(False, False)
         
         # Make dialog modal
@@ -320,14 +316,6 @@ class PairSelectionDialog(ctk.CTkToplevel):
         
         # Create widgets
         self._create_widgets()
-        
-        # Center dialog
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = parent.winfo_rootx() + (parent.winfo_width() // 2) - (width // 2)
-        y = parent.winfo_rooty() + (parent.winfo_height() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
     
     def _load_preferences(self):
         """Load saved pair preferences."""
@@ -346,7 +334,7 @@ class PairSelectionDialog(ctk.CTkToplevel):
         title_label = ctk.CTkLabel(
             main_frame,
             text="Select Trading Pairs to Display",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         title_label.pack(pady=(0, 10))
         
@@ -354,7 +342,7 @@ class PairSelectionDialog(ctk.CTkToplevel):
         info_label = ctk.CTkLabel(
             main_frame,
             text="Choose which trading pair to display for each asset in your portfolio.",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             justify="left"
         )
         info_label.pack(pady=(0, 10), fill="x")
@@ -431,7 +419,7 @@ class PairSelectionDialog(ctk.CTkToplevel):
             asset_label = ctk.CTkLabel(
                 asset_frame,
                 text=f"{asset}:",
-                font=ctk.CTkFont(weight="bold"),
+                font=get_font(weight="bold"),
                 width=100
             )
             asset_label.grid(row=0, column=0, padx=5, pady=5, sticky="w")
@@ -2,18 +2,28 @@ import os
 import json
 import threading
 import importlib.util
+import sys
+import tkinter as tk
 import customtkinter as ctk
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 
 # Get the absolute path of the current script
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
 
-# Import modules directly using file paths
+# Import modules directly using file paths (each file is loaded once and shared)
 def import_from_file(module_name, file_path):
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    key = f"binance_tracker:{os.path.normcase(os.path.abspath(file_path))}"
+    module = sys.modules.get(key)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[key] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[key]
+            raise
     return module
 
 # Import required modules
@@ -21,6 +31,7 @@ core_auth = import_from_file("auth", os.path.join(project_root, "core", "auth.py
 core_api_client = import_from_file("api_client", os.path.join(project_root, "core", "api_client.py"))
 core_calculator = import_from_file("calculator", os.path.join(project_root, "core", "calculator.py"))
 ui_dialogs = import_from_file("dialogs", os.path.join(current_dir, "dialogs.py"))
+ui_utils = import_from_file("ui_utils", os.path.join(current_dir, "ui_utils.py"))
 ui_asset_button = import_from_file("asset_button", os.path.join(current_dir, "widgets", "asset_button.py"))
 ui_asset_detail = import_from_file("asset_detail", os.path.join(current_dir, "widgets", "asset_detail.py"))
 
@@ -32,12 +43,20 @@ BinanceApiClient = core_api_client.BinanceApiClient
 format_currency = core_calculator.format_currency
 format_crypto_amount = core_calculator.format_crypto_amount
 format_percent = core_calculator.format_percent
+Position = core_calculator.Position
+split_symbol = core_calculator.split_symbol
 SetupDialog = ui_dialogs.SetupDialog
 PinDialog = ui_dialogs.PinDialog
 PairSelectionDialog = ui_dialogs.PairSelectionDialog
+center_on_parent = ui_utils.center_on_parent
+get_font = ui_utils.get_font
 AssetButton = ui_asset_button.AssetButton
 AssetDetailFrame = ui_asset_detail.AssetDetailFrame
 
+# PnL colors
+_PNL_POS = "#4CAF50"  # Green
+_PNL_NEG = "#F44336"  # Red
+
 
 class MainWindow(ctk.CTk):
     """
@@ -48,6 +67,12 @@ class MainWindow(ctk.CTk):
         """Initialize the main window."""
         super().__init__()
         
+        # Shared fonts
+        self._font_title = get_font(16, "bold")
+        self._font_bold = get_font(weight="bold")
+        self._font_status = get_font(12, "bold")
+        self._font_pnl = get_font(12)
+        
         # Set window properties
         self.title("Binance Portfolio Tracker")
         self.geometry("1000x600")
@@ -61,6 +86,17 @@ class MainWindow(ctk.CTk):
         self.update_thread = None
         self.stop_update = False
         
+        # Reusable PIN dialog for reconnecting
+        self._pin_dialog = None
+        self._pin_parent = None
+        
+        # Reconnect / asset loading state
+        self._loading = False
+        
+        # Pending asset button updates (symbol -> (balance, usd_value))
+        self._pending_updates: Dict[str, Tuple[float, float]] = {}
+        self._flush_scheduled = False
+        
         # Set theme
         ctk.set_appearance_mode(self.config.get("theme", "dark"))
         ctk.set_default_color_theme("blue")
@@ -182,7 +218,7 @@ class MainWindow(ctk.CTk):
         sidebar_label = ctk.CTkLabel(
             self.sidebar,
             text="Assets",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_title
         )
         sidebar_label.pack(pady=(0, 10))
         
@@ -209,14 +245,14 @@ class MainWindow(ctk.CTk):
         self.portfolio_value_label = ctk.CTkLabel(
             self.portfolio_frame,
             text="Total: $0.00",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._font_status
         )
         self.portfolio_value_label.pack(side="left", padx=5)
         
         self.portfolio_pnl_label = ctk.CTkLabel(
             self.portfolio_frame,
             text="PnL: $0.00 (0.00%)",
-            font=ctk.CTkFont(size=12)
+            font=self._font_pnl
         )
         self.portfolio_pnl_label.pack(side="left", padx=5)
     
@@ -284,14 +320,29 @@ class MainWindow(ctk.CTk):
                 # Get non-zero balances with minimum value of $1
                 balances = self.api_client.get_spot_balances(min_value=1.0)
                 
+                # Pre-format asset button text off the Tk thread
+                for balance in balances:
+                    balance['value_text'] = format_currency(balance['usd_value'])
+                    balance['total_text'] = format_crypto_amount(balance['total'])
+                
                 # Update UI in main thread
-                self.after(0, lambda: self._update_asset_list(balances))
+                self.after(0, self._update_asset_list, balances)
             except Exception as e:
                 print(f"Error loading assets: {e}")
-                self.after(0, lambda: self.status_label.configure(text=f"Error: {str(e)}"))
+                self.after(0, self._show_load_error, f"Error: {str(e)}")
         
         threading.Thread(target=fetch_balances).start()
     
+    def _show_load_error(self, error_text: str) -> None:
+        """
+        Show an asset loading error.
+        
+        Args:
+            error_text: Error message
+        """
+        self._loading = False
+        self.status_label.configure(text=error_text)
+    
     def _update_asset_list(self, balances: List[Dict]) -> None:
         """
         Update asset list with balances.
@@ -299,6 +350,9 @@ class MainWindow(ctk.CTk):
         Args:
             balances: List of balance dictionaries
         """
+        # Loading is finished once the result reaches the Tk thread
+        self._loading = False
+        
         # Store balances for later use
         self.balances = balances
         
@@ -349,7 +403,9 @@ class MainWindow(ctk.CTk):
                 symbol=pair,
                 balance=balance['total'],
                 usd_value=balance['usd_value'],
-                command=lambda s=pair: self._select_asset(s)
+                command=lambda s=pair: self._select_asset(s),
+                preformatted_value=balance.get('value_text'),
+                preformatted_balance=balance.get('total_text')
             )
             button.pack(fill="x", pady=2)
             self.asset_buttons[pair] = button
@@ -385,27 +441,7 @@ class MainWindow(ctk.CTk):
             self.asset_detail.set_loading(True)
             
             # Get asset details in a separate thread
-            def fetch_details():
-                try:
-                    # Get order history
-                    orders = self.api_client.get_order_history(symbol)
-                    
-                    # Get open orders
-                    open_orders = self.api_client.get_open_orders(symbol)
-                    
-                    # Calculate position metrics
-                    metrics = self.api_client.calculate_position_metrics(symbol)
-                    
-                    # Add open orders to metrics
-                    metrics['open_orders'] = open_orders
-                    
-                    # Update UI in main thread
-                    self.after(0, lambda: self._update_asset_detail(symbol, orders, metrics))
-                except Exception as e:
-                    print(f"Error loading asset details: {e}")
-                    self.after(0, lambda: self.asset_detail.set_error(str(e)))
-            
-            threading.Thread(target=fetch_details).start()
+            threading.Thread(target=self._fetch_asset_details, args=(symbol,)).start()
     
     def _update_asset_detail(self, symbol: str, orders: List[Dict], metrics: Dict) -> None:
         """
@@ -434,7 +470,7 @@ class MainWindow(ctk.CTk):
             def price_update(data):
                 if data['symbol'] == symbol:
                     price = data['price']
-                    self.asset_detail.update_price(price)
+                    self.asset_detail.update_price(price, symbol)
             
             self.api_client.start_symbol_ticker_websocket(symbol, price_update)
     
@@ -457,31 +493,53 @@ class MainWindow(ctk.CTk):
             self.asset_detail.set_loading(True)
             
             # Get asset details in a separate thread
-            def fetch_details():
-                try:
-                    # Get order history
-                    orders = self.api_client.get_order_history(symbol)
-                    
-                    # Get open orders
-                    open_orders = self.api_client.get_open_orders(symbol)
-                    
-                    # Calculate position metrics
-                    metrics = self.api_client.calculate_position_metrics(symbol)
-                    
-                    # Add open orders to metrics
-                    metrics['open_orders'] = open_orders
-                    
-                    # Update UI in main thread
-                    self.after(0, lambda: self._update_asset_detail(symbol, orders, metrics))
-                    
-                    # Add a button for this asset if it doesn't exist
-                    if symbol not in self.asset_buttons:
-                        self.after(0, lambda: self._add_asset_button(symbol, metrics))
-                except Exception as e:
-                    print(f"Error loading asset details: {e}")
-                    self.after(0, lambda: self.asset_detail.set_error(str(e)))
+            threading.Thread(target=self._fetch_asset_details, args=(symbol, True)).start()
+    
+    def _fetch_asset_payload(self, symbol: str) -> Tuple[List[Dict], Position]:
+        """
+        Fetch order history and position metrics for a symbol.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
             
-            threading.Thread(target=fetch_details).start()
+        Returns:
+            Tuple of (orders, metrics)
+        """
+        # Get order history
+        orders = self.api_client.get_order_history(symbol)
+        
+        # Get open orders
+        open_orders = self.api_client.get_open_orders(symbol)
+        
+        # Calculate position metrics
+        metrics = self.api_client.calculate_position_metrics(symbol)
+        
+        # Add open orders to metrics
+        metrics.open_orders = open_orders
+        
+        return orders, metrics
+    
+    def _fetch_asset_details(self, symbol: str, add_button: bool = False) -> None:
+        """
+        Fetch asset details in a worker thread and post them to the UI.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            add_button: Whether to add a sidebar button for the symbol
+        """
+        try:
+            orders, metrics = self._fetch_asset_payload(symbol)
+            
+            # Update UI in main thread
+            self.after(0, self._update_asset_detail, symbol, orders, metrics)
+            
+            # Add a button for this asset if it doesn't exist
+            if add_button and symbol not in self.asset_buttons:
+                self.after(0, self._add_asset_button, symbol, metrics)
+        except Exception as e:
+            print(f"Error loading asset details: {e}")
+            error_message = str(e)
+            self.after(0, self.asset_detail.set_error, error_message)
     
     def _add_asset_button(self, symbol: str, metrics: Dict) -> None:
         """
@@ -495,8 +553,7 @@ class MainWindow(ctk.CTk):
             return
             
         # Extract base and quote assets
-        base_asset = symbol[-4:] if symbol[-4:] in ['USDT', 'USDC', 'BUSD', 'USDK'] else symbol[-3:]
-        quote_asset = symbol[:-len(base_asset)]
+        quote_asset, base_asset = split_symbol(symbol)
         
         # Create button text
         button_text = f"{quote_asset}/{base_asset}"
@@ -516,6 +573,47 @@ class MainWindow(ctk.CTk):
         # Store button reference
         self.asset_buttons[symbol] = button
     
+    def _update_asset_balances(self, balances: Dict[str, Tuple[float, float]]) -> None:
+        """
+        Queue updated spot balances for the asset buttons.
+        
+        Args:
+            balances: Dictionary of asset -> (total balance, usd_value)
+        """
+        for symbol, button in self.asset_buttons.items():
+            # Assets missing from the refresh keep their last balance
+            values = balances.get(button.asset)
+            if values is not None:
+                self.queue_update(symbol, *values)
+    
+    def queue_update(self, symbol: str, balance: float, usd_value: float) -> None:
+        """
+        Queue an asset button update to be applied on the next idle cycle.
+        
+        Later updates for the same symbol replace earlier pending ones.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            balance: New balance
+            usd_value: New USD value
+        """
+        self._pending_updates[symbol] = (balance, usd_value)
+        
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_updates)
+    
+    def _flush_updates(self) -> None:
+        """Apply all pending asset button updates."""
+        pending = self._pending_updates
+        self._pending_updates = {}
+        self._flush_scheduled = False
+        
+        for symbol, (balance, usd_value) in pending.items():
+            button = self.asset_buttons.get(symbol)
+            if button:
+                button.update_balance(balance, usd_value)
+    
     def _start_portfolio_updates(self) -> None:
         """Start periodic portfolio updates."""
         if self.update_thread is not None:
@@ -527,22 +625,30 @@ class MainWindow(ctk.CTk):
             while not self.stop_update:
                 try:
                     if self.api_client:
-                        # Get all position metrics
-                        positions = []
-                        for symbol in self.asset_buttons.keys():
+                        # Accumulate portfolio totals while fetching position metrics
+                        total_cost = 0.0
+                        total_value = 0.0
+                        for symbol in list(self.asset_buttons.keys()):
                             metrics = self.api_client.calculate_position_metrics(symbol)
-                            positions.append(metrics)
+                            total_cost += metrics.total_cost
+                            total_value += metrics.current_value
                         
+                        # Asset buttons show the spot account balance, as when they were created
+                        balances = {
+                            balance['asset']: (balance['total'], balance['usd_value'])
+                            for balance in self.api_client.get_spot_balances()
+                        }
+
                         # Calculate portfolio summary
-                        total_cost = sum(p['total_cost'] for p in positions)
-                        total_value = sum(p['current_value'] for p in positions)
                         pnl_amount = total_value - total_cost
                         pnl_percent = (pnl_amount / total_cost) * 100 if total_cost > 0 else 0
                         
                         # Update UI in main thread
-                        self.after(0, lambda: self._update_portfolio_summary(
+                        self.after(0, self._update_asset_balances, balances)
+                        self.after(
+                            0, self._update_portfolio_summary,
                             total_value, pnl_amount, pnl_percent
-                        ))
+                        )
                 except Exception as e:
                     print(f"Error updating portfolio: {e}")
                 
@@ -570,7 +676,7 @@ class MainWindow(ctk.CTk):
         
         # Format PnL with color
         pnl_text = f"PnL: {format_currency(pnl_amount)} ({format_percent(pnl_percent)})"
-        pnl_color = "#4CAF50" if pnl_amount >= 0 else "#F44336"
+        pnl_color = _PNL_POS if pnl_amount >= 0 else _PNL_NEG
         
         self.portfolio_pnl_label.configure(text=pnl_text, text_color=pnl_color)
     
@@ -587,6 +693,12 @@ class MainWindow(ctk.CTk):
             theme: Theme name ('dark' or 'light')
         """
         ctk.set_appearance_mode(theme)
+        
+        # Refresh asset button borders for the new theme
+        AssetButton.invalidate_border_cache()
+        for button in self.asset_buttons.values():
+            button.set_selected(button.selected)
+        
         self.config["theme"] = theme
         self._save_config()
     
@@ -609,7 +721,7 @@ class MainWindow(ctk.CTk):
         # Create dialog
         dialog = ctk.CTkToplevel(self)
         dialog.title("API Management")
-        dialog.geometry("400x350")
+        center_on_parent(dialog, self, 400, 350)
         dialog.resizable(False, False)
         
         # Make dialog modal
@@ -624,7 +736,7 @@ class MainWindow(ctk.CTk):
         title_label = ctk.CTkLabel(
             main_frame,
             text="API Management",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font_title
         )
         title_label.pack(pady=(0, 20))
         
@@ -636,7 +748,7 @@ class MainWindow(ctk.CTk):
         status_label = ctk.CTkLabel(
             status_frame,
             text="API Status:",
-            font=ctk.CTkFont(weight="bold")
+            font=self._font_bold
         )
         status_label.pack(side="left", padx=10, pady=10)
         
@@ -686,14 +798,7 @@ class MainWindow(ctk.CTk):
             command=dialog.destroy
         )
         close_button.pack(pady=(0, 10))
-        
-        # Center dialog
-        dialog.update_idletasks()
-        width = dialog.winfo_width()
-        height = dialog.winfo_height()
-        x = self.winfo_rootx() + (self.winfo_width() // 2) - (width // 2)
-        y = self.winfo_rooty() + (self.winfo_height() // 2) - (height // 2)
-        dialog.geometry(f"{width}x{height}+{x}+{y}")
+
     
     def _add_new_api(self, parent_dialog) -> None:
         """
@@ -732,7 +837,7 @@ class MainWindow(ctk.CTk):
         # Confirm dialog
         confirm_dialog = ctk.CTkToplevel(parent_dialog)
         confirm_dialog.title("Confirm")
-        confirm_dialog.geometry("300x150")
+        center_on_parent(confirm_dialog, parent_dialog, 300, 150)
         confirm_dialog.resizable(False, False)
         
         # Make dialog modal
@@ -795,125 +900,208 @@ class MainWindow(ctk.CTk):
             command=confirm_forget
         )
         confirm_button.pack(side="right", padx=5, pady=5, expand=True)
-        
-        # Center dialog
-        confirm_dialog.update_idletasks()
-        width = confirm_dialog.winfo_width()
-        height = confirm_dialog.winfo_height()
-        x = parent_dialog.winfo_rootx() + (parent_dialog.winfo_width() // 2) - (width // 2)
-        y = parent_dialog.winfo_rooty() + (parent_dialog.winfo_height() // 2) - (height // 2)
-        confirm_dialog.geometry(f"{width}x{height}+{x}+{y}")
+
             
     def _reconnect_api(self, parent_dialog) -> None:
-            """
-            Reconnect to the last used API using stored credentials.
-            
-            Args:
-                parent_dialog: Parent dialog
-            """
-            # Import necessary functions from core_auth
-            get_stored_credentials = core_auth.get_stored_credentials
-            
-            # Create PIN entry dialog
-            pin_dialog = ctk.CTkToplevel(parent_dialog)
-            pin_dialog.title("Enter PIN")
-            pin_dialog.geometry("300x180")
-            pin_dialog.resizable(False, False)
-            
-            # Make dialog modal
-            pin_dialog.transient(parent_dialog)
-            pin_dialog.grab_set()
-            
-            # Create main frame
-            main_frame = ctk.CTkFrame(pin_dialog)
-            main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-            
-            # Create label
-            label = ctk.CTkLabel(
-                main_frame,
-                text="Enter your 4-digit PIN to reconnect:",
-                wraplength=250
-            )
-            label.pack(pady=(0, 20))
-            
-            # PIN entry
-            pin_entry = ctk.CTkEntry(main_frame, width=100, show="*")
-            pin_entry.pack(pady=(0, 20))
-            pin_entry.focus_set()
-            
-            # Error label
-            error_label = ctk.CTkLabel(
-                main_frame,
-                text="",
-                text_color="#F44336"  # Red color for errors
-            )
-            error_label.pack(pady=(0, 10))
-            
-            # Buttons frame
-            buttons_frame = ctk.CTkFrame(main_frame)
-            buttons_frame.pack(fill="x")
-            
-            # Cancel button
-            cancel_button = ctk.CTkButton(
-                buttons_frame,
-                text="Cancel",
-                command=pin_dialog.destroy
-            )
-            cancel_button.pack(side="left", padx=5, pady=5, expand=True)
-            
-            # Connect function
-            def try_connect():
-                pin = pin_entry.get()
-                
-                # Validate PIN
-                if not pin.isdigit() or len(pin) != 4:
-                    error_label.configure(text="PIN must be 4 digits")
-                    return
-                
-                # Try to get stored credentials
-                try:
-                    api_key, api_secret = get_stored_credentials(pin)
-                    
-                    if api_key and api_secret:
-                        # Close existing WebSockets if any
-                        if self.api_client:
-                            self.api_client.close_websockets()
-                        
-                        # Initialize API client
-                        self.api_client = BinanceApiClient(api_key, api_secret)
-                        self.status_label.configure(text="Connected to Binance")
-                        
-                        # Load data
-                        self._load_assets()
-                        
-                        # Close dialogs
-                        pin_dialog.destroy()
-                        parent_dialog.destroy()
-                    else:
-                        error_label.configure(text="Invalid PIN or no credentials stored")
-                except Exception as e:
-                    error_label.configure(text=f"Error: {str(e)}")
+        """
+        Reconnect to the last used API using stored credentials.
+        
+        Args:
+            parent_dialog: Parent dialog
+        """
+        # Get (or create) the PIN entry dialog
+        self._pin_parent = parent_dialog
+        pin_dialog = self._get_pin_dialog()
+        
+        # Center dialog while it is still hidden
+        center_on_parent(pin_dialog, parent_dialog, 300, 180)
+        
+        # Show dialog and make it modal once it is visible
+        was_visible = pin_dialog.winfo_viewable()
+        pin_dialog.transient(parent_dialog)
+        pin_dialog.deiconify()
+        if not was_visible:
+            pin_dialog.wait_visibility()
+        pin_dialog.grab_set()
+        self._pin_entry.focus_set()
+    
+    def _get_pin_dialog(self) -> ctk.CTkToplevel:
+        """
+        Get the PIN entry dialog used for reconnecting, creating it on first use.
+        
+        The dialog is withdrawn instead of destroyed after a successful
+        connection, so later reconnects only reset its fields.
+        
+        Returns:
+            PIN entry dialog
+        """
+        if self._pin_dialog is not None and self._pin_dialog.winfo_exists():
+            # Reset fields from the previous use
+            self._pin_entry.delete(0, "end")
+            self._pin_error_label.configure(text="")
+            self._pin_connect_button.configure(state="normal")
             
-            # Connect button
-            connect_button = ctk.CTkButton(
-                buttons_frame,
-                text="Connect",
-                command=try_connect,
-                fg_color="#2E7D32",  # Green color
-                hover_color="#1B5E20"  # Darker green on hover
+            # Match the buttons frame to the current theme
+            main_frame = self._pin_buttons_frame.master
+            self._pin_buttons_frame.configure(
+                bg=main_frame._apply_appearance_mode(main_frame.cget("fg_color"))
             )
-            connect_button.pack(side="right", padx=5, pady=5, expand=True)
-            
-            # Bind Enter key to try_connect
-            pin_entry.bind("<Return>", lambda event: try_connect())
+            return self._pin_dialog
+        
+        # Create PIN entry dialog
+        pin_dialog = ctk.CTkToplevel(self)
+        pin_dialog.withdraw()
+        pin_dialog.title("Enter PIN")
+        pin_dialog.geometry("300x180")
+        pin_dialog.resizable(False, False)
+        pin_dialog.protocol("WM_DELETE_WINDOW", self._hide_pin_dialog)
+        
+        # Create main frame
+        main_frame = ctk.CTkFrame(pin_dialog)
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        # Create label
+        label = ctk.CTkLabel(
+            main_frame,
+            text="Enter your 4-digit PIN to reconnect:",
+            wraplength=250
+        )
+        label.pack(pady=(0, 20))
+        
+        # PIN entry
+        pin_entry = ctk.CTkEntry(main_frame, width=100, show="*")
+        pin_entry.pack(pady=(0, 20))
+        
+        # Error label
+        error_label = ctk.CTkLabel(
+            main_frame,
+            text="",
+            text_color="#F44336"  # Red color for errors
+        )
+        error_label.pack(pady=(0, 10))
+        
+        # Buttons frame (plain Tk frame, it only lays out the two buttons)
+        buttons_frame = tk.Frame(
+            main_frame,
+            bg=main_frame._apply_appearance_mode(main_frame.cget("fg_color")),
+            highlightthickness=0
+        )
+        buttons_frame.pack(fill="x")
+        
+        # Cancel button
+        cancel_button = ctk.CTkButton(
+            buttons_frame,
+            text="Cancel",
+            command=self._hide_pin_dialog
+        )
+        cancel_button.pack(side="left", padx=5, pady=5, expand=True)
+        
+        # Connect button
+        connect_button = ctk.CTkButton(
+            buttons_frame,
+            text="Connect",
+            command=self._try_pin_connect,
+            fg_color="#2E7D32",  # Green color
+            hover_color="#1B5E20"  # Darker green on hover
+        )
+        connect_button.pack(side="right", padx=5, pady=5, expand=True)
+        
+        # Bind Enter key to connect
+        pin_entry.bind("<Return>", lambda event: self._try_pin_connect())
+        
+        # Store dialog widgets for reuse
+        self._pin_dialog = pin_dialog
+        self._pin_entry = pin_entry
+        self._pin_error_label = error_label
+        self._pin_connect_button = connect_button
+        self._pin_buttons_frame = buttons_frame
+        
+        return pin_dialog
+    
+    def _hide_pin_dialog(self) -> None:
+        """Hide the PIN dialog, keeping it for the next reconnect."""
+        self._pin_dialog.grab_release()
+        self._pin_dialog.withdraw()
+    
+    def _try_pin_connect(self) -> None:
+        """Validate the entered PIN and start connecting in the background."""
+        # Ignore repeated attempts while connecting or loading assets
+        if self._loading:
+            self._pin_error_label.configure(text="Already connecting...")
+            return
+        
+        pin = self._pin_entry.get()
+        
+        # Validate PIN
+        if not pin.isdigit() or len(pin) != 4:
+            self._pin_error_label.configure(text="PIN must be 4 digits")
+            return
+        
+        # Decrypt credentials and connect in a separate thread
+        self._pin_error_label.configure(text="")
+        self._pin_connect_button.configure(state="disabled")
+        self._loading = True
+        threading.Thread(target=self._do_connect, args=(pin,), daemon=True).start()
+    
+    def _do_connect(self, pin: str) -> None:
+        """
+        Decrypt stored credentials and create an API client (worker thread).
+        
+        Args:
+            pin: 4-digit PIN
+        """
+        try:
+            api_key, api_secret = core_auth.get_stored_credentials(pin)
             
-            # Center dialog
-            pin_dialog.update_idletasks()
-            width = pin_dialog.winfo_width()
-            height = pin_dialog.winfo_height()
-            x = parent_dialog.winfo_rootx() + (parent_dialog.winfo_width() // 2) - (width // 2)
-            y = parent_dialog.winfo_rooty() + (parent_dialog.winfo_height() // 2) - (height // 2)
-            pin_dialog.geometry(f"{width}x{height}+{x}+{y}")
+            if api_key and api_secret:
+                result = BinanceApiClient(api_key, api_secret)
+            else:
+                result = None
+        except Exception as e:
+            result = e
+        
+        # Finish in main thread
+        self.after(0, self._finish_connect, result)
+    
+    def _finish_connect(self, result) -> None:
+        """
+        Apply the result of a reconnect attempt.
+        
+        Args:
+            result: New API client, None if the PIN was rejected, or the raised exception
+        """
+        # Ignore the result if the PIN dialog was closed in the meantime
+        if (self._pin_dialog is None or not self._pin_dialog.winfo_exists()
+                or self._pin_dialog.state() == "withdrawn"):
+            self._loading = False
+            return
+        
+        self._pin_connect_button.configure(state="normal")
+        
+        if isinstance(result, Exception):
+            self._loading = False
+            self._pin_error_label.configure(text=f"Error: {str(result)}")
+            return
+        
+        if result is None:
+            self._loading = False
+            self._pin_error_label.configure(text="Invalid PIN or no credentials stored")
+            return
+        
+        # Close existing WebSockets if any
+        if self.api_client:
+            self.api_client.close_websockets()
+        
+        # Use new API client
+        self.api_client = result
+        self.status_label.configure(text="Connected to Binance")
+        
+        # Load data (clears the loading flag when the balances arrive)
+        self._load_assets()
+        
+        # Hide PIN dialog for reuse and close parent dialog
+        self._hide_pin_dialog()
+        self._pin_parent.destroy()
     
     def _on_close(self) -> None:
         """Handle window close event."""
@@ -0,0 +1,41 @@
+import customtkinter as ctk
+from typing import Optional
+
+
+# Fonts shared by all windows, keyed by (size, weight)
+_FONTS = {}
+
+
+def get_font(size: Optional[int] = None, weight: str = "normal") -> ctk.CTkFont:
+    """
+    Get a shared font, creating it on first use.
+    
+    Args:
+        size: Font size (None for the theme default)
+        weight: 'normal' or 'bold'
+        
+    Returns:
+        Shared CTkFont instance
+    """
+    font = _FONTS.get((size, weight))
+    if font is None:
+        font = _FONTS[(size, weight)] = ctk.CTkFont(size=size, weight=weight)
+    return font
+
+
+def center_on_parent(dialog, parent, width: int, height: int):
+    """
+    Size a dialog and center it over its parent with a single geometry call.
+    
+    The dialog's size is passed in rather than measured, so no layout pass
+    is forced.
+    
+    Args:
+        dialog: Dialog to place
+        parent: Window to center the dialog on
+        width: Dialog width
+        height: Dialog height
+    """
+    x = parent.winfo_rootx() + (parent.winfo_width() // 2) - (width // 2)
+    y = parent.winfo_rooty() + (parent.winfo_height() // 2) - (height // 2)
+    dialog.geometry(f"{width}x{height}+{x}+{y}")
@@ -1,5 +1,6 @@
 import os
 import importlib.util
+import sys
 import customtkinter as ctk
 from typing import Callable, Optional
 
@@ -8,19 +9,29 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 widgets_dir = os.path.dirname(current_dir)
 project_root = os.path.dirname(widgets_dir)
 
-# Import modules directly using file paths
+# Import modules directly using file paths (each file is loaded once and shared)
 def import_from_file(module_name, file_path):
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    key = f"binance_tracker:{os.path.normcase(os.path.abspath(file_path))}"
+    module = sys.modules.get(key)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[key] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[key]
+            raise
     return module
 
 # Import required modules
 core_calculator = import_from_file("calculator", os.path.join(project_root, "core", "calculator.py"))
+ui_utils = import_from_file("ui_utils", os.path.join(widgets_dir, "ui_utils.py"))
 
 # Get required functions
 format_currency = core_calculator.format_currency
 format_crypto_amount = core_calculator.format_crypto_amount
+get_font = ui_utils.get_font
 
 
 class AssetButton(ctk.CTkFrame):
@@ -28,6 +39,17 @@ class AssetButton(ctk.CTkFrame):
     Custom button widget for displaying an asset in the sidebar.
     """
     
+    # Border colors by (selected, appearance mode)
+    _BORDER = {
+        (True, "dark"): "#1F6AA5",  # Blue
+        (True, "light"): "#1F6AA5",  # Blue
+        (False, "dark"): "#2B2B2B",
+        (False, "light"): "#DBDBDB"
+    }
+    
+    # Appearance mode cached on first use
+    _cached_mode = None
+    
     def __init__(
         self,
         master,
@@ -36,6 +58,8 @@ class AssetButton(ctk.CTkFrame):
         balance: float,
         usd_value: float,
         command: Optional[Callable] = None,
+        preformatted_value: Optional[str] = None,
+        preformatted_balance: Optional[str] = None,
         **kwargs
     ):
         """
@@ -48,6 +72,8 @@ class AssetButton(ctk.CTkFrame):
             balance: Asset balance
             usd_value: USD value of the balance
             command: Callback function when button is clicked
+            preformatted_value: Already formatted USD value text (optional)
+            preformatted_balance: Already formatted balance text (optional)
             **kwargs: Additional arguments for CTkFrame
         """
         super().__init__(master, **kwargs)
@@ -60,8 +86,17 @@ class AssetButton(ctk.CTkFrame):
         self.command = command
         self.selected = False
         
-        # Configure frame
+        # Last rendered label text
+        if preformatted_balance is None:
+            preformatted_balance = format_crypto_amount(balance)
+        if preformatted_value is None:
+            preformatted_value = format_currency(usd_value)
+        self._last_balance_text = preformatted_balance
+        self._last_value_text = preformatted_value
+        
+        # Configure frame (fixed height since labels are placed, not gridded)
         self.configure(
+            height=66,
             corner_radius=6,
             border_width=1,
             border_color=self._get_border_color(False)
@@ -70,40 +105,52 @@ class AssetButton(ctk.CTkFrame):
         # Create layout
         self._create_widgets()
         
+        # Bound setters used on every update
+        self._set_value_text = self._value_var.set
+        self._set_balance_text = self._balance_var.set
+        
         # Bind events
         self.bind("<Button-1>", self._on_click)
-        for child in self.winfo_children():
-            child.bind("<Button-1>", self._on_click)
+        
+        # Route label clicks through a single binding on this frame's tag
+        tag = str(self)
+        self.bind_class(tag, "<Button-1>", self._on_click)
+        for child in self._children:
+            for widget in child.winfo_children():
+                widget.bindtags((tag,) + widget.bindtags())
     
     def _create_widgets(self):
         """Create button widgets."""
-        # Create grid layout
-        self.grid_columnconfigure(0, weight=1)
-        self.grid_columnconfigure(1, weight=1)
+        # Label text variables
+        self._value_var = ctk.StringVar(self, value=self._last_value_text)
+        self._balance_var = ctk.StringVar(self, value=self._last_balance_text)
         
         # Asset name
         self.asset_label = ctk.CTkLabel(
             self,
             text=self.asset,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
-        self.asset_label.grid(row=0, column=0, sticky="w", padx=10, pady=(5, 0))
+        self.asset_label.place(relx=0.0, rely=0.0, anchor="nw", x=10, y=5)
         
         # USD value
         self.value_label = ctk.CTkLabel(
             self,
-            text=format_currency(self.usd_value),
-            font=ctk.CTkFont(size=12)
+            textvariable=self._value_var,
+            font=get_font(12)
         )
-        self.value_label.grid(row=0, column=1, sticky="e", padx=10, pady=(5, 0))
+        self.value_label.place(relx=1.0, rely=0.0, anchor="ne", x=-10, y=5)
         
         # Balance
         self.balance_label = ctk.CTkLabel(
             self,
-            text=format_crypto_amount(self.balance),
-            font=ctk.CTkFont(size=12)
+            textvariable=self._balance_var,
+            font=get_font(12)
         )
-        self.balance_label.grid(row=1, column=0, columnspan=2, sticky="w", padx=10, pady=(0, 5))
+        self.balance_label.place(relx=0.0, rely=1.0, anchor="sw", x=10, y=-5)
+        
+        # Keep track of child widgets for event binding
+        self._children = [self.asset_label, self.value_label, self.balance_label]
     
     def _on_click(self, event):
         """
@@ -135,10 +182,15 @@ class AssetButton(ctk.CTkFrame):
         Returns:
             Border color
         """
-        if selected:
-            return "#1F6AA5"  # Blue
-        else:
-            return "#2B2B2B" if ctk.get_appearance_mode() == "dark" else "#DBDBDB"
+        cls = type(self)
+        if cls._cached_mode is None:
+            cls._cached_mode = ctk.get_appearance_mode().lower()
+        return cls._BORDER[(selected, cls._cached_mode)]
+    
+    @classmethod
+    def invalidate_border_cache(cls):
+        """Forget the cached appearance mode (call after changing the theme)."""
+        cls._cached_mode = None
     
     def update_balance(self, balance: float, usd_value: float):
         """
@@ -151,5 +203,13 @@ class AssetButton(ctk.CTkFrame):
         self.balance = balance
         self.usd_value = usd_value
         
-        self.balance_label.configure(text=format_crypto_amount(balance))
-        self.value_label.configure(text=format_currency(usd_value))
\ No newline at end of file
+        # Only set text variables whose text actually changed
+        balance_text = format_crypto_amount(balance)
+        if balance_text != self._last_balance_text:
+            self._set_balance_text(balance_text)
+            self._last_balance_text = balance_text
+        
+        value_text = format_currency(usd_value)
+        if value_text != self._last_value_text:
+            self._set_value_text(value_text)
+            self._last_value_text = value_text
\ No newline at end of file
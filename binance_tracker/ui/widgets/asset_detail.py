@@ -1,29 +1,200 @@
 import os
+import bisect
+import datetime
 import importlib.util
+import sys
+import tkinter as tk
+from tkinter import ttk
 import customtkinter as ctk
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set
+import queue
+import random
 import threading
 import time
+from functools import lru_cache
+
+# Optional fast number parsing
+try:
+    from fastnumbers import try_float
+except ImportError:
+    try_float = None
+
+# Alert sound through winsound on Windows, the terminal bell elsewhere
+try:
+    import winsound
+except ImportError:
+    winsound = None
 
 # Get the absolute path of the current script
 current_dir = os.path.dirname(os.path.abspath(__file__))
 widgets_dir = os.path.dirname(current_dir)
 project_root = os.path.dirname(widgets_dir)
 
-# Import modules directly using file paths
+# Import modules directly using file paths (each file is loaded once and shared)
 def import_from_file(module_name, file_path):
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    key = f"binance_tracker:{os.path.normcase(os.path.abspath(file_path))}"
+    module = sys.modules.get(key)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[key] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[key]
+            raise
     return module
 
 # Import required modules
 core_calculator = import_from_file("calculator", os.path.join(project_root, "core", "calculator.py"))
+ui_utils = import_from_file("ui_utils", os.path.join(widgets_dir, "ui_utils.py"))
 
 # Get required functions
 format_currency = core_calculator.format_currency
 format_crypto_amount = core_calculator.format_crypto_amount
 format_percent = core_calculator.format_percent
+split_symbol = core_calculator.split_symbol
+center_on_parent = ui_utils.center_on_parent
+get_font = ui_utils.get_font
+
+def _parse_float(text: str) -> Optional[float]:
+    """
+    Parse user input as a float.
+    
+    Args:
+        text: Text to parse
+        
+    Returns:
+        Parsed value, or None if the text is not a number
+    """
+    if try_float is not None:
+        return try_float(text, on_fail=None, on_type_error=None)
+    try:
+        return float(text)
+    except (ValueError, TypeError):
+        return None
+
+
+def _beep():
+    """Play the alert sound."""
+    if winsound is not None:
+        winsound.Beep(1000, 500)  # 1000 Hz for 500 ms
+    else:
+        os.write(2, b"\a")  # ASCII bell character on stderr
+
+
+# Filter periods in seconds
+_FILTER_PERIODS = {"24h": 24 * 3600, "7d": 7 * 24 * 3600, "30d": 30 * 24 * 3600}
+
+
+def _order_epoch(order: Dict) -> float:
+    """
+    Get an order's time as a local epoch timestamp.
+    
+    Parsed times are cached by their text rather than stored on the order,
+    since manual orders are the dicts that get saved to disk.
+    
+    Args:
+        order: Order dictionary with 'time' formatted as '%Y-%m-%d %H:%M:%S'
+            (or a raw Binance timestamp in milliseconds)
+        
+    Returns:
+        Epoch seconds, or 0.0 if the time is missing or malformed
+    """
+    return _parse_order_time(order.get('time', ''))
+
+
+@lru_cache(maxsize=8192)
+def _parse_order_time(order_time) -> float:
+    """Parse an order time (cached, see _order_epoch)."""
+    if isinstance(order_time, (int, float)):
+        return order_time / 1000
+    try:
+        return time.mktime(time.strptime(order_time, '%Y-%m-%d %H:%M:%S'))
+    except (ValueError, TypeError, OverflowError):
+        return 0.0
+
+
+class _OrderView:
+    """
+    Display fields of an order, with the numbers parsed once.
+    """
+    
+    __slots__ = ('order_id', 'time', 'side', 'price', 'qty', 'total', 'is_manual')
+    
+    def __init__(self, order: Dict, price_key: str, qty_key: str, total_key: Optional[str] = None):
+        """
+        Initialize order view.
+        
+        Args:
+            order: Order dictionary
+            price_key: Key of the order price
+            qty_key: Key of the order quantity
+            total_key: Key of the order total (None = price * quantity)
+        """
+        self.order_id = order.get('orderId')
+        self.time = order.get('time', '')
+        self.side = order.get('side', '')
+        self.price = float(order.get(price_key, 0))
+        self.qty = float(order.get(qty_key, 0))
+        self.total = float(order.get(total_key, 0)) if total_key else self.price * self.qty
+        self.is_manual = order.get('isManual', False)
+    
+    @classmethod
+    def from_history(cls, order: Dict) -> '_OrderView':
+        """Create a view of a filled order from the order history."""
+        return cls(order, 'avgPrice', 'executedQty', 'cummulativeQuoteQty')
+    
+    @classmethod
+    def from_open_order(cls, order: Dict) -> '_OrderView':
+        """Create a view of an open order (amount = locked quantity)."""
+        return cls(order, 'price', 'lockedQty')
+
+
+# Background worker shared by all detail frames (one thread, tasks run in order)
+_task_queue = queue.SimpleQueue()
+_worker_lock = threading.Lock()
+_worker_started = False
+
+
+def _submit_task(owner, tag: str, fn: Callable):
+    """
+    Queue a task for the shared background worker, starting it on first use.
+    
+    If several tasks with the same owner and tag are waiting, only the latest runs.
+    
+    Args:
+        owner: Object the task belongs to (e.g. an AssetDetailFrame)
+        tag: Task kind (e.g. 'recalc')
+        fn: Function to run in the worker thread
+    """
+    global _worker_started
+    if not _worker_started:
+        with _worker_lock:
+            if not _worker_started:
+                threading.Thread(target=_run_tasks, daemon=True).start()
+                _worker_started = True
+    _task_queue.put(((id(owner), tag), fn))
+
+
+def _run_tasks():
+    """Run queued background tasks, dropping superseded ones."""
+    while True:
+        # Wait for a task, then collect everything else already queued
+        key, fn = _task_queue.get()
+        tasks = {key: fn}
+        while True:
+            try:
+                key, fn = _task_queue.get_nowait()
+            except queue.Empty:
+                break
+            tasks[key] = fn
+        
+        for fn in tasks.values():
+            try:
+                fn()
+            except Exception as e:
+                print(f"Error in background task: {e}")
 
 
 class AssetDetailFrame(ctk.CTkFrame):
@@ -43,14 +214,141 @@ class AssetDetailFrame(ctk.CTkFrame):
         
         # Initialize variables
         self.symbol = None
+        self._base_asset = ""
+        self._quote_asset = ""
         self.orders = []
+        self._orders_by_time = None  # Orders sorted oldest first (built on demand)
+        self._order_ts = None  # Epoch timestamps matching _orders_by_time
+        
+        # Order table paging (rows shown grow by one page per "Load more")
+        self._filtered_orders = []
+        self._page_size = 100
+        self._page_end = self._page_size
         self.metrics = {}
-        self.include_orders = {}
+        self.include_orders = {}  # symbol -> set of order IDs excluded from calculations
+        # Price alerts checked whenever a new price arrives:
+        # symbol -> alert type -> (sorted alert prices, alerts in the same order)
+        self.price_alerts = {}
         self._api_client = None  # Reference to the API client
         
+        # Recent metrics for selected orders: (symbol, order ids) -> (time, metrics)
+        # (only used on the Tk thread)
+        self._metrics_cache = {}
+        self._metrics_ttl = 30.0
+        
+        # Pending debounced recalculation after order toggles
+        self._toggle_after_id = None
+        
+        # Last rendered (text, color) per label
+        self._last_text = {}
+        
+        # Open orders table, its row item IDs and appearance mode (created on first use)
+        self._open_orders_table = None
+        self._open_order_rows = []
+        self._open_orders_shown = 0
+        self._open_orders_mode = None
+        self._open_order_key = None  # (open orders list, quote asset) last shown
+        
+        # Current widget states, to skip redundant configure() calls
+        self._pair_btn_enabled = False
+        self._active_filter = None
+        
+        # Trading pairs from the API: (fetch time, pairs, asset -> pairs containing it)
+        self._pairs_cache = None
+        self._pairs_ttl = 300.0
+        
+        # Reusable dialogs: name -> (dialog, input widgets)
+        self._dialogs = {}
+        
+        # Last PnL shown, rounded to display precision
+        self._last_pnl_disp = None
+        
+        # Signature of the data last rendered by _update_ui
+        self._last_render_sig = None
+        
+        # Latest (symbol, price) waiting to be drawn (at most _max_redraw_hz times per second)
+        self._pending_price = None
+        self._price_flush_scheduled = False
+        self._max_redraw_hz = 20
+        self._last_paint = 0.0
+        
+        # Status message label (created on first message) and the pending
+        # after() id that clears it
+        self.message_label = None
+        self._clear_after_id = None
+        
         # Create widgets
         self._create_widgets()
     
+    def _center_dialog(self, dialog, width: int, height: int):
+        """
+        Size a dialog and center it over the main window.
+        
+        Args:
+            dialog: Dialog to place
+            width: Dialog width
+            height: Dialog height
+        """
+        center_on_parent(dialog, self.winfo_toplevel(), width, height)
+    
+    def _reuse_dialog(self, name: str, width: int, height: int) -> Optional[tuple]:
+        """
+        Show a dialog built by an earlier call again, centered and modal.
+        
+        Args:
+            name: Dialog name in self._dialogs
+            width: Dialog width
+            height: Dialog height
+            
+        Returns:
+            The dialog's input widgets, or None if the dialog must be built
+        """
+        entry = self._dialogs.get(name)
+        if entry is None or not entry[0].winfo_exists():
+            return None
+        
+        dialog, fields = entry
+        self._center_dialog(dialog, width, height)
+        dialog.deiconify()
+        dialog.transient(self.winfo_toplevel())
+        dialog.grab_set()
+        return fields
+    
+    def _keep_dialog(self, name: str, dialog, fields: tuple):
+        """
+        Keep a dialog for reuse; closing it hides it instead of destroying it.
+        
+        Args:
+            name: Dialog name in self._dialogs
+            dialog: Dialog to keep
+            fields: Input widgets to reset on reuse
+        """
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(name))
+        self._dialogs[name] = (dialog, fields)
+    
+    def _hide_dialog(self, name: str):
+        """
+        Hide a reusable dialog.
+        
+        Args:
+            name: Dialog name in self._dialogs
+        """
+        dialog = self._dialogs[name][0]
+        dialog.grab_release()
+        dialog.withdraw()
+    
+    def _submit(self, tag: str, fn: Callable):
+        """
+        Queue a task for the background worker.
+        
+        If several tasks with the same tag are waiting, only the latest runs.
+        
+        Args:
+            tag: Task kind (e.g. 'recalc')
+            fn: Function to run in the worker thread
+        """
+        _submit_task(self, tag, fn)
+    
     def _create_widgets(self):
         """Create frame widgets."""
         # Create main layout
@@ -72,7 +370,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         self.symbol_label = ctk.CTkLabel(
             symbol_frame,
             text="Select an asset",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(20, "bold")
         )
         self.symbol_label.pack(side="left", padx=(0, 5))
         
@@ -87,17 +385,21 @@ class AssetDetailFrame(ctk.CTkFrame):
         self.change_pair_btn.pack(side="left", padx=5)
         self.change_pair_btn.configure(state="disabled")  # Initially disabled
         
-        # Price label
+        # Price label (fixed width and right-aligned so price changes don't relayout)
         self.price_label = ctk.CTkLabel(
             self.header_frame,
             text="",
-            font=ctk.CTkFont(size=20)
+            width=220,
+            anchor="e",
+            font=get_font(20)
         )
         self.price_label.grid(row=0, column=1, sticky="e", padx=10, pady=10)
         
-        # Metrics frame
-        self.metrics_frame = ctk.CTkFrame(self)
+        # Metrics frame (fixed height for its six rows, so value changes
+        # don't propagate a relayout to the whole frame)
+        self.metrics_frame = ctk.CTkFrame(self, height=228)
         self.metrics_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 10))
+        self.metrics_frame.grid_propagate(False)
         
         self.metrics_frame.grid_columnconfigure(0, weight=1)
         self.metrics_frame.grid_columnconfigure(1, weight=1)
@@ -106,29 +408,34 @@ class AssetDetailFrame(ctk.CTkFrame):
         holdings_label = ctk.CTkLabel(
             self.metrics_frame,
             text="Holdings:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         holdings_label.grid(row=0, column=0, sticky="w", padx=10, pady=5)
         
         self.holdings_value = ctk.CTkLabel(
             self.metrics_frame,
             text="",
-            font=ctk.CTkFont(size=14)
+            width=220,
+            anchor="e",
+            font=get_font(14)
         )
         self.holdings_value.grid(row=0, column=1, sticky="e", padx=10, pady=5)
+        self._default_text_color = self.holdings_value.cget("text_color")
         
         # Available
         available_label = ctk.CTkLabel(
             self.metrics_frame,
             text="Available:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         available_label.grid(row=1, column=0, sticky="w", padx=10, pady=5)
         
         self.available_value = ctk.CTkLabel(
             self.metrics_frame,
             text="",
-            font=ctk.CTkFont(size=14)
+            width=220,
+            anchor="e",
+            font=get_font(14)
         )
         self.available_value.grid(row=1, column=1, sticky="e", padx=10, pady=5)
         
@@ -136,14 +443,16 @@ class AssetDetailFrame(ctk.CTkFrame):
         locked_label = ctk.CTkLabel(
             self.metrics_frame,
             text="Locked:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         locked_label.grid(row=2, column=0, sticky="w", padx=10, pady=5)
         
         self.locked_value = ctk.CTkLabel(
             self.metrics_frame,
             text="",
-            font=ctk.CTkFont(size=14)
+            width=220,
+            anchor="e",
+            font=get_font(14)
         )
         self.locked_value.grid(row=2, column=1, sticky="e", padx=10, pady=5)
         
@@ -151,14 +460,16 @@ class AssetDetailFrame(ctk.CTkFrame):
         avg_buy_label = ctk.CTkLabel(
             self.metrics_frame,
             text="Avg Buy:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         avg_buy_label.grid(row=3, column=0, sticky="w", padx=10, pady=5)
         
         self.avg_buy_value = ctk.CTkLabel(
             self.metrics_frame,
             text="",
-            font=ctk.CTkFont(size=14)
+            width=220,
+            anchor="e",
+            font=get_font(14)
         )
         self.avg_buy_value.grid(row=3, column=1, sticky="e", padx=10, pady=5)
         
@@ -166,14 +477,16 @@ class AssetDetailFrame(ctk.CTkFrame):
         break_even_label = ctk.CTkLabel(
             self.metrics_frame,
             text="Break-even:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         break_even_label.grid(row=4, column=0, sticky="w", padx=10, pady=5)
         
         self.break_even_value = ctk.CTkLabel(
             self.metrics_frame,
             text="",
-            font=ctk.CTkFont(size=14)
+            width=220,
+            anchor="e",
+            font=get_font(14)
         )
         self.break_even_value.grid(row=4, column=1, sticky="e", padx=10, pady=5)
         
@@ -181,14 +494,16 @@ class AssetDetailFrame(ctk.CTkFrame):
         pnl_label = ctk.CTkLabel(
             self.metrics_frame,
             text="PnL:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         pnl_label.grid(row=5, column=0, sticky="w", padx=10, pady=5)
         
         self.pnl_value = ctk.CTkLabel(
             self.metrics_frame,
             text="",
-            font=ctk.CTkFont(size=14)
+            width=220,
+            anchor="e",
+            font=get_font(14)
         )
         self.pnl_value.grid(row=5, column=1, sticky="e", padx=10, pady=5)
         
@@ -204,10 +519,20 @@ class AssetDetailFrame(ctk.CTkFrame):
         order_label = ctk.CTkLabel(
             order_header_frame,
             text="Order History",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         order_label.pack(side="left")
         
+        # Load more button (shown orders are limited to whole pages)
+        self.load_more_btn = ctk.CTkButton(
+            order_header_frame,
+            text="Load more",
+            width=100,
+            state="disabled",
+            command=self._load_more_orders
+        )
+        self.load_more_btn.pack(side="right")
+        
         # Control panel frame
         control_panel = ctk.CTkFrame(self.order_frame)
         control_panel.pack(fill="x", padx=10, pady=(0, 10))
@@ -308,7 +633,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         open_orders_label = ctk.CTkLabel(
             open_orders_header,
             text="Open Orders",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         )
         open_orders_label.pack(side="left", padx=10, pady=5)
         
@@ -320,7 +645,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         self.no_open_orders_label = ctk.CTkLabel(
             self.open_orders_content,
             text="No open orders",
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.no_open_orders_label.pack(padx=10, pady=10)
         
@@ -328,7 +653,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         self.loading_label = ctk.CTkLabel(
             self,
             text="Loading...",
-            font=ctk.CTkFont(size=16)
+            font=get_font(16)
         )
         
         # Error label
@@ -336,7 +661,7 @@ class AssetDetailFrame(ctk.CTkFrame):
             self,
             text="",
             text_color="#F44336",
-            font=ctk.CTkFont(size=14)
+            font=get_font(14)
         )
     
     def set_loading(self, loading: bool):
@@ -390,37 +715,71 @@ class AssetDetailFrame(ctk.CTkFrame):
         # Store data
         self.symbol = symbol
         self.orders = orders
+        self._order_ts = None
+        self._metrics_cache.clear()
+        
+        # Drop any tick still waiting for the previous symbol
+        self._pending_price = None
+        
+        # Split symbol once (e.g. 'BTCUSDT' -> 'USDT' and 'BTC')
+        self._quote_asset, self._base_asset = split_symbol(symbol)
         self.metrics = metrics
         
-        # Initialize order inclusion if needed
-        if not self.include_orders or symbol not in self.include_orders:
-            self.include_orders[symbol] = {order['orderId']: True for order in orders}
+        # Initialize order inclusion if needed (all orders included)
+        self.include_orders.setdefault(symbol, set())
         
         # Update UI
         self._update_ui()
+        self._check_price_alerts(metrics.get('current_price', 0))
         
         # Enable change pair button
-        self.change_pair_btn.configure(state="normal")
+        if not self._pair_btn_enabled:
+            self.change_pair_btn.configure(state="normal")
+            self._pair_btn_enabled = True
         
         # Hide loading indicator
         self.set_loading(False)
     
-    def update_price(self, price: float):
+    def update_price(self, price: float, symbol: Optional[str] = None):
         """
         Update current price.
         
         Args:
             price: Current price
+            symbol: Symbol the price belongs to (defaults to the current symbol)
         """
         if self.symbol:
+            # Keep only the latest price and limit how often it is drawn
+            self._pending_price = (symbol or self.symbol, price)
+            if not self._price_flush_scheduled:
+                self._price_flush_scheduled = True
+                remaining = 1.0 / self._max_redraw_hz - (time.monotonic() - self._last_paint)
+                if remaining > 0:
+                    self.after(int(remaining * 1000) + 1, self._flush_price)
+                else:
+                    self.after_idle(self._flush_price)
+    
+    def _flush_price(self):
+        """Draw the latest price received by update_price."""
+        self._price_flush_scheduled = False
+        self._last_paint = time.monotonic()
+        pending = self._pending_price
+        self._pending_price = None
+        
+        # Ignore ticks for a symbol that is no longer shown
+        if self.symbol and pending is not None and pending[0] == self.symbol:
+            price = pending[1]
+            
             # Update price label
-            self.price_label.configure(text=format_currency(price))
+            self._set_text(self.price_label, format_currency(price))
+            self._check_price_alerts(price)
             
             # Update metrics with new price
-            if self.metrics:
+            metrics = self.metrics
+            if metrics:
                 # Calculate new PnL
-                holdings = self.metrics.get('holdings', 0)
-                avg_buy = self.metrics.get('avg_buy_price', 0)
+                holdings = metrics.get('holdings', 0)
+                avg_buy = metrics.get('avg_buy_price', 0)
                 
                 if holdings > 0 and avg_buy > 0:
                     current_value = holdings * price
@@ -431,49 +790,95 @@ class AssetDetailFrame(ctk.CTkFrame):
                     # Update PnL display
                     self._update_pnl(pnl_amount, pnl_percent)
     
+    def _set_text(self, label: ctk.CTkLabel, text: str, color: Optional[str] = None):
+        """
+        Set label text (and color), skipping the call if nothing changed.
+        
+        Args:
+            label: Label to update
+            text: New text
+            color: New text color (optional)
+        """
+        if self._last_text.get(label) == (text, color):
+            return
+        
+        if color is None:
+            label.configure(text=text)
+        else:
+            label.configure(text=text, text_color=color)
+        self._last_text[label] = (text, color)
+    
     def _update_ui(self):
         """Update UI with current data."""
         if not self.symbol or not self.metrics:
             return
+        
+        # Skip repaint if the same data was already rendered
+        # (built from every value the panel shows)
+        metrics = self.metrics
+        sig = (
+            self.symbol,
+            metrics.get('current_price'),
+            metrics.get('holdings'),
+            metrics.get('available'),
+            metrics.get('locked'),
+            metrics.get('avg_buy_price'),
+            metrics.get('break_even_price'),
+            metrics.get('pnl_amount'),
+            metrics.get('pnl_percent'),
+            id(metrics.get('open_orders')),
+            id(self.orders),
+            len(self.orders),
+            frozenset(self.include_orders.get(self.symbol, ()))
+        )
+        if sig == self._last_render_sig:
+            return
+        self._last_render_sig = sig
             
         # Update symbol and price
-        base_asset = self.symbol[-4:] if self.symbol[-4:] in ['USDT', 'USDC', 'BUSD'] else self.symbol[-3:]
-        quote_asset = self.symbol[:-len(base_asset)]
+        base_asset = self._base_asset
+        quote_asset = self._quote_asset
         
-        self.symbol_label.configure(text=f"{quote_asset}/{base_asset}")
-        self.price_label.configure(text=format_currency(self.metrics.get('current_price', 0)))
+        self._set_text(self.symbol_label, f"{quote_asset}/{base_asset}")
+        self._set_text(self.price_label, format_currency(self.metrics.get('current_price', 0)))
         
         # Update metrics
-        self.holdings_value.configure(
-            text=f"{format_crypto_amount(self.metrics.get('holdings', 0))} {quote_asset}"
+        self._set_text(
+            self.holdings_value,
+            f"{format_crypto_amount(self.metrics.get('holdings', 0))} {quote_asset}"
         )
         
         # Update available and locked amounts
         available = self.metrics.get('available', 0)
         locked = self.metrics.get('locked', 0)
         
-        self.available_value.configure(
-            text=f"{format_crypto_amount(available)} {quote_asset}"
+        self._set_text(
+            self.available_value,
+            f"{format_crypto_amount(available)} {quote_asset}"
         )
         
         # Show locked amount with different color if non-zero
         if locked > 0:
-            self.locked_value.configure(
-                text=f"{format_crypto_amount(locked)} {quote_asset}",
-                text_color="#FFA500"  # Orange color for locked amounts
+            self._set_text(
+                self.locked_value,
+                f"{format_crypto_amount(locked)} {quote_asset}",
+                "#FFA500"  # Orange color for locked amounts
             )
         else:
-            self.locked_value.configure(
-                text=f"{format_crypto_amount(locked)} {quote_asset}",
-                text_color=self.holdings_value.cget("text_color")  # Reset to default color
+            self._set_text(
+                self.locked_value,
+                f"{format_crypto_amount(locked)} {quote_asset}",
+                self._default_text_color  # Reset to default color
             )
         
-        self.avg_buy_value.configure(
-            text=format_currency(self.metrics.get('avg_buy_price', 0))
+        self._set_text(
+            self.avg_buy_value,
+            format_currency(self.metrics.get('avg_buy_price', 0))
         )
         
-        self.break_even_value.configure(
-            text=format_currency(self.metrics.get('break_even_price', 0))
+        self._set_text(
+            self.break_even_value,
+            format_currency(self.metrics.get('break_even_price', 0))
         )
         
         # Update PnL
@@ -482,7 +887,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         self._update_pnl(pnl_amount, pnl_percent)
         
         # Update order table
-        self.order_table.update_orders(self.orders, self.include_orders.get(self.symbol, {}))
+        self._show_orders(self.orders)
         
         # Update open orders display
         self._update_open_orders()
@@ -495,6 +900,12 @@ class AssetDetailFrame(ctk.CTkFrame):
             pnl_amount: Profit/loss amount
             pnl_percent: Profit/loss percentage
         """
+        # Nothing to do if the PnL is unchanged at display precision
+        disp = (round(pnl_percent, 4), round(pnl_amount, 8))
+        if disp == self._last_pnl_disp:
+            return
+        self._last_pnl_disp = disp
+        
         # Format PnL text
         pnl_text = f"{format_percent(pnl_percent)} ({format_currency(pnl_amount)})"
         
@@ -502,7 +913,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         pnl_color = "#4CAF50" if pnl_amount >= 0 else "#F44336"
         
         # Update label
-        self.pnl_value.configure(text=pnl_text, text_color=pnl_color)
+        self._set_text(self.pnl_value, pnl_text, pnl_color)
     
     def _on_order_toggle(self, order_id: int, include: bool):
         """
@@ -514,18 +925,23 @@ class AssetDetailFrame(ctk.CTkFrame):
         """
         if self.symbol:
             # Update order inclusion
-            if self.symbol not in self.include_orders:
-                self.include_orders[self.symbol] = {}
-                
-            self.include_orders[self.symbol][order_id] = include
+            excluded = self.include_orders.setdefault(self.symbol, set())
+            if include:
+                excluded.discard(order_id)
+            else:
+                excluded.add(order_id)
             
-            # Recalculate metrics (in a separate thread to avoid UI freeze)
-            def recalculate():
-                # TODO: Implement recalculation with API client
-                # For now, just update UI
-                self.after(0, self._update_ui)
-                
-            threading.Thread(target=recalculate).start()
+            # Recalculate once a burst of toggles has settled
+            if self._toggle_after_id is not None:
+                self.after_cancel(self._toggle_after_id)
+            self._toggle_after_id = self.after(150, self._run_toggle_recalc)
+    
+    def _run_toggle_recalc(self):
+        """Recalculate after order toggles (debounced by _on_order_toggle)."""
+        self._toggle_after_id = None
+        
+        # One background recalculation for the whole burst
+        self._calculate_selected()
     
     def _filter_orders(self, period: str):
         """
@@ -538,41 +954,115 @@ class AssetDetailFrame(ctk.CTkFrame):
             return
             
         # Highlight active filter button
-        self.filter_all_btn.configure(fg_color=("#3B8ED0" if period == "all" else "#1F6AA5"))
-        self.filter_24h_btn.configure(fg_color=("#3B8ED0" if period == "24h" else "#1F6AA5"))
-        self.filter_7d_btn.configure(fg_color=("#3B8ED0" if period == "7d" else "#1F6AA5"))
-        self.filter_30d_btn.configure(fg_color=("#3B8ED0" if period == "30d" else "#1F6AA5"))
-        
-        # If 'all', show all orders
-        if period == "all":
-            self.order_table.update_orders(self.orders, self.include_orders.get(self.symbol, {}))
+        filter_buttons = {
+            "all": self.filter_all_btn,
+            "24h": self.filter_24h_btn,
+            "7d": self.filter_7d_btn,
+            "30d": self.filter_30d_btn
+        }
+        if self._active_filter is None:
+            # First use: buttons still have the theme color
+            for name, button in filter_buttons.items():
+                button.configure(fg_color=("#3B8ED0" if name == period else "#1F6AA5"))
+        elif period != self._active_filter:
+            # Only recolor the previous and the new active button
+            if self._active_filter in filter_buttons:
+                filter_buttons[self._active_filter].configure(fg_color="#1F6AA5")
+            if period in filter_buttons:
+                filter_buttons[period].configure(fg_color="#3B8ED0")
+        self._active_filter = period
+        
+        # Show all orders for 'all' (or an unknown period)
+        seconds = _FILTER_PERIODS.get(period)
+        if seconds is None:
+            self._show_orders(self.orders)
             return
             
-        # Calculate cutoff time based on period
-        import datetime
-        import time
+        # Filter in the background worker
+        orders = self.orders
+        count = len(orders)
+        order_ts = self._order_ts
+        orders_by_time = self._orders_by_time
+        cutoff = time.time() - seconds
+        
+        def run_filter():
+            index_ts, index_orders = order_ts, orders_by_time
+            
+            # Build the time index if the orders changed
+            if index_ts is None:
+                stamped = sorted(
+                    ((_order_epoch(order), order) for order in orders[:count]),
+                    key=lambda item: item[0]
+                )
+                index_ts = [ts for ts, _ in stamped]
+                index_orders = [order for _, order in stamped]
+            
+            # Find the first order at or after the cutoff (newest first for display)
+            idx = bisect.bisect_left(index_ts, cutoff)
+            filtered_orders = index_orders[idx:][::-1]
+            
+            self.after(
+                0, self._apply_filter,
+                period, orders, count, index_ts, index_orders, filtered_orders
+            )
         
-        now = datetime.datetime.now()
+        self._submit('filter', run_filter)
+    
+    def _apply_filter(self, period: str, orders: List[Dict], count: int,
+                      order_ts: List[float], orders_by_time: List[Dict],
+                      filtered_orders: List[Dict]):
+        """
+        Show the result of a background order filter.
         
-        if period == "24h":
-            cutoff = now - datetime.timedelta(hours=24)
-        elif period == "7d":
-            cutoff = now - datetime.timedelta(days=7)
-        elif period == "30d":
-            cutoff = now - datetime.timedelta(days=30)
-        else:
-            # Default to all orders
-            self.order_table.update_orders(self.orders, self.include_orders.get(self.symbol, {}))
+        Args:
+            period: Period the result was computed for
+            orders: Order list that was filtered
+            count: Number of orders in that list at the time
+            order_ts: Time index built for the list
+            orders_by_time: Orders matching order_ts
+            filtered_orders: Orders within the period (newest first)
+        """
+        # Ignore stale results (orders changed or another filter was chosen)
+        if orders is not self.orders or count != len(orders) or period != self._active_filter:
             return
-            
-        # Convert cutoff to timestamp
-        cutoff_timestamp = cutoff.strftime('%Y-%m-%d %H:%M:%S')
         
-        # Filter orders
-        filtered_orders = [order for order in self.orders if order.get('time', '') >= cutoff_timestamp]
+        # Keep the index for later filters
+        self._order_ts = order_ts
+        self._orders_by_time = orders_by_time
         
         # Update order table with filtered orders
-        self.order_table.update_orders(filtered_orders, self.include_orders.get(self.symbol, {}))
+        self._show_orders(filtered_orders)
+    
+    def _show_orders(self, orders: List[Dict]):
+        """
+        Show orders in the order table, starting from the first page.
+        
+        Showing the same list again keeps the pages already loaded.
+        
+        Args:
+            orders: Orders to show (newest first)
+        """
+        if orders is not self._filtered_orders:
+            self._filtered_orders = orders
+            self._page_end = self._page_size
+        
+        self._render_page()
+    
+    def _render_page(self):
+        """Render the loaded pages of the current order list."""
+        self.order_table.update_orders(
+            self._filtered_orders[:self._page_end],
+            self.include_orders.get(self.symbol, set())
+        )
+        
+        # Only offer more rows if some are hidden
+        has_more = len(self._filtered_orders) > self._page_end
+        self.load_more_btn.configure(state="normal" if has_more else "disabled")
+    
+    def _load_more_orders(self):
+        """Show the next page of orders."""
+        self._page_end += self._page_size
+        self._render_page()
     
     def _calculate_selected(self):
         """Calculate metrics based on selected orders only."""
@@ -580,57 +1070,116 @@ class AssetDetailFrame(ctk.CTkFrame):
             return
             
         # Get selected order IDs
+        excluded = self.include_orders.get(self.symbol, set())
         selected_order_ids = [
-            order_id for order_id, include in self.include_orders.get(self.symbol, {}).items()
-            if include
+            order['orderId'] for order in self.orders
+            if order['orderId'] not in excluded
         ]
         
         # If no orders are selected, show a message
         if not selected_order_ids:
             self._show_message("Please select at least one order to calculate metrics.")
             return
-            
+        
+        # Everything the worker needs is read here, on the Tk thread
+        symbol = self.symbol
+        api_client = self._api_client
+        invalid_symbol = "Invalid symbol" in self.get_message()
+        
         # Show calculating message
         self._show_message("Calculating metrics for selected orders...")
         
+        if not api_client:
+            self._show_message("API client not available.")
+            return
+        
+        if invalid_symbol:
+            # Show dialog to enter current price manually
+            self._prompt_manual_price(selected_order_ids)
+            return
+        
+        # Reuse recent results for the same selection
+        key = (symbol, frozenset(selected_order_ids))
+        cached_at, metrics = self._metrics_cache.get(key, (0.0, None))
+        if metrics is not None and time.monotonic() - cached_at < self._metrics_ttl:
+            self._update_metrics(metrics)
+            self._clear_message_later(500)
+            return
+        
         # Recalculate metrics with selected orders
         def recalculate():
             try:
-                if self._api_client:
-                    # Check if we need to handle a special case for invalid symbols
-                    if "Invalid symbol" in self.get_message():
-                        # Show dialog to enter current price manually
-                        self.after(0, lambda: self._prompt_manual_price(selected_order_ids))
-                    else:
-                        # Calculate metrics with selected orders
-                        metrics = self._api_client.calculate_position_metrics(self.symbol, selected_order_ids)
-                        
-                        # Update metrics in UI
-                        self.after(0, lambda: self._update_metrics(metrics))
-                        
-                        # Clear message
-                        self.after(500, lambda: self._clear_message())
-                else:
-                    self.after(0, lambda: self._show_message("API client not available."))
+                calculated_at = time.monotonic()
+                metrics = api_client.calculate_position_metrics(symbol, selected_order_ids)
+                
+                # Cache and show the result in the Tk thread
+                self.after(0, self._finish_recalc, key, calculated_at, metrics)
             except Exception as e:
                 error_msg = str(e)
-                self.after(0, lambda: self._show_message(f"Error calculating metrics: {error_msg}"))
+                self.after(0, self._show_message, f"Error calculating metrics: {error_msg}")
                 
                 # If it's an invalid symbol error or price retrieval error, prompt for symbol mapping
                 if "Invalid symbol" in error_msg or "price" in error_msg.lower():
-                    self.after(100, lambda: self._prompt_symbol_mapping(selected_order_ids))
+                    self.after(100, self._prompt_symbol_mapping, selected_order_ids)
                 
-        threading.Thread(target=recalculate).start()
+        self._submit('recalc', recalculate)
+    
+    def _finish_recalc(self, key: tuple, calculated_at: float, metrics):
+        """
+        Cache and show metrics calculated by _calculate_selected.
+        
+        Args:
+            key: (symbol, frozenset of order IDs)
+            calculated_at: time.monotonic() when the calculation started
+            metrics: Position metrics
+        """
+        # Drop results for a symbol the user has already left
+        if key[0] != self.symbol:
+            return
+        
+        self._store_metrics(key, calculated_at, metrics)
+        self._update_metrics(metrics)
+        self._clear_message_later(500)
+    
+    def _store_metrics(self, key: tuple, cached_at: float, metrics):
+        """
+        Cache metrics for a set of selected orders, evicting expired entries.
+        
+        Args:
+            key: (symbol, frozenset of order IDs)
+            cached_at: time.monotonic() when the metrics were calculated
+            metrics: Position metrics
+        """
+        if len(self._metrics_cache) >= 128:
+            self._metrics_cache = {
+                k: v for k, v in self._metrics_cache.items()
+                if cached_at - v[0] < self._metrics_ttl
+            }
+        self._metrics_cache[key] = (cached_at, metrics)
     
     def _add_manual_order(self):
         """Add a manual order to the order history."""
         if not self.symbol:
             return
+        
+        # Reuse the dialog from a previous call
+        fields = self._reuse_dialog("manual_order", 400, 350)
+        if fields is not None:
+            side_var, date_entry, price_entry, amount_entry, error_label = fields
+            
+            # Reset fields
+            side_var.set("BUY")
+            date_entry.delete(0, "end")
+            date_entry.insert(0, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            price_entry.delete(0, "end")
+            amount_entry.delete(0, "end")
+            error_label.configure(text="")
+            return
             
         # Create dialog
         dialog = ctk.CTkToplevel(self)
         dialog.title("Add Manual Order")
-        dialog.geometry("400x350")
+        self._center_dialog(dialog, 400, 350)
         dialog.resizable(False, False)
         
         # Make dialog modal
@@ -645,7 +1194,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             main_frame,
             text="Add Manual Order",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -682,7 +1231,6 @@ class AssetDetailFrame(ctk.CTkFrame):
         date_label.grid(row=1, column=0, sticky="w", padx=10, pady=5)
         
         # Get current date and time
-        import datetime
         now = datetime.datetime.now()
         date_str = now.strftime("%Y-%m-%d %H:%M:%S")
         
@@ -719,97 +1267,11 @@ class AssetDetailFrame(ctk.CTkFrame):
         cancel_button = ctk.CTkButton(
             button_frame,
             text="Cancel",
-            command=dialog.destroy
+            command=lambda: self._hide_dialog("manual_order")
         )
         cancel_button.pack(side="left", padx=10, pady=10, expand=True)
         
         # Add order function
-        def toggle_consolidated_view(self):
-            """
-            Toggle between single pair and consolidated view for this asset
-            """
-            # Extract base asset from symbol
-            base_asset = self.symbol[-4:] if self.symbol[-4:] in ['USDT', 'USDC', 'BUSD', 'USDK'] else self.symbol[-3:]
-            asset = self.symbol[:-len(base_asset)]
-            
-            if not hasattr(self, 'is_consolidated_view') or not self.is_consolidated_view:
-                # Switch to consolidated view
-                self.is_consolidated_view = True
-                
-                # Save current symbol for switching back
-                self.original_symbol = self.symbol
-                
-                # Update title
-                self.title_label.configure(text=f"{asset} (All Pairs)")
-                
-                # Get consolidated order history
-                if self._api_client:
-                    # Show loading message
-                    self.set_loading(True)
-                    
-                    # Get data in a separate thread
-                    def fetch_consolidated_data():
-                        try:
-                            # Get consolidated order history
-                            orders = self._api_client.get_consolidated_order_history(asset)
-                            
-                            # Calculate consolidated metrics
-                            metrics = self._api_client.calculate_consolidated_position_metrics(asset)
-                            
-                            # Update UI in main thread
-                            self.after(0, lambda: self._update_consolidated_view(orders, metrics))
-                        except Exception as e:
-                            self.after(0, lambda: self.set_error(str(e)))
-                    
-                    import threading
-                    threading.Thread(target=fetch_consolidated_data).start()
-            else:
-                # Switch back to single pair view
-                self.is_consolidated_view = False
-                
-                # Restore original symbol
-                if hasattr(self, 'original_symbol'):
-                    self.update_data(self.original_symbol, self.orders, self.metrics)
-                else:
-                    self.update_data(self.symbol, self.orders, self.metrics)
-        
-        def _update_consolidated_view(self, orders, metrics):
-            """
-            Update the UI with consolidated data
-            
-            Args:
-                orders: Consolidated order list
-                metrics: Consolidated metrics
-            """
-            # Update orders and metrics
-            self.orders = orders
-            self.metrics = metrics
-            
-            # Hide loading indicator
-            self.loading_label.grid_remove()
-            
-            # Update metrics display
-            self._update_metrics_display(metrics)
-            
-            # Update order table
-            self.order_table.update_orders(orders, {})
-            
-            # Show trading pairs used
-            if 'trading_pairs' in metrics and metrics['trading_pairs']:
-                pairs_text = "Trading pairs: " + ", ".join(metrics['trading_pairs'])
-                if not hasattr(self, 'pairs_label'):
-                    self.pairs_label = ctk.CTkLabel(
-                        self.metrics_frame,
-                        text=pairs_text,
-                        font=("Roboto", 10)
-                    )
-                    self.pairs_label.grid(row=10, column=0, columnspan=4, sticky="w", padx=10, pady=(5, 0))
-                else:
-                    self.pairs_label.configure(text=pairs_text)
-                    self.pairs_label.grid()
-            elif hasattr(self, 'pairs_label'):
-                self.pairs_label.grid_remove()
-        
         def add_order():
             try:
                 # Get values
@@ -823,19 +1285,15 @@ class AssetDetailFrame(ctk.CTkFrame):
                     error_label.configure(text="All fields are required")
                     return
                     
-                try:
-                    price = float(price_str)
-                    amount = float(amount_str)
-                except ValueError:
+                price = _parse_float(price_str)
+                amount = _parse_float(amount_str)
+                if price is None or amount is None:
                     error_label.configure(text="Price and amount must be numbers")
                     return
                 
                 # Create order dictionary
-                import time
-                import random
-                
                 # Generate a unique order ID (negative to avoid conflicts with real orders)
-                order_id = -int(time.time() * 1000) - random.randint(1, 1000)
+                order_id = -((time.time_ns() // 1_000_000) << 10 | random.getrandbits(10))
                 
                 # Calculate total
                 total = price * amount
@@ -855,25 +1313,24 @@ class AssetDetailFrame(ctk.CTkFrame):
                 
                 # Add to orders list
                 self.orders.append(order)
+                self._order_ts = None
+                self._metrics_cache.clear()
                 
                 # Include in calculations
-                if self.symbol not in self.include_orders:
-                    self.include_orders[self.symbol] = {}
-                self.include_orders[self.symbol][order_id] = True
+                self.include_orders.setdefault(self.symbol, set()).discard(order_id)
                 
                 # Save to API client for persistence
                 if self._api_client:
                     self._api_client.add_manual_order(order)
                 
                 # Update order table
-                self.order_table.update_orders(self.orders, self.include_orders.get(self.symbol, {}))
+                self._show_orders(self.orders)
                 
                 # Close dialog
-                dialog.destroy()
+                self._hide_dialog("manual_order")
                 
                 # Show success message
-                self._show_message("Manual order added successfully")
-                self.after(2000, lambda: self._clear_message())
+                self._show_message("Manual order added successfully", clear_after=2000)
                 
             except Exception as e:
                 error_label.configure(text=f"Error: {str(e)}")
@@ -885,30 +1342,27 @@ class AssetDetailFrame(ctk.CTkFrame):
         )
         add_button.pack(side="right", padx=10, pady=10, expand=True)
         
-        # Center dialog
-        dialog.update_idletasks()
-        width = dialog.winfo_width()
-        height = dialog.winfo_height()
-        x = self.winfo_toplevel().winfo_rootx() + (self.winfo_toplevel().winfo_width() // 2) - (width // 2)
-        y = self.winfo_toplevel().winfo_rooty() + (self.winfo_toplevel().winfo_height() // 2) - (height // 2)
-        dialog.geometry(f"{width}x{height}+{x}+{y}")
+        # Keep the dialog for reuse
+        self._keep_dialog("manual_order", dialog, (side_var, date_entry, price_entry, amount_entry, error_label))
+        
     
-    def _show_message(self, message: str) -> str:
+    def _show_message(self, message: str, clear_after: Optional[int] = None) -> str:
         """
         Show a message in the UI.
         
         Args:
             message: Message to display
+            clear_after: Milliseconds until the message is cleared (None = keep it)
             
         Returns:
             The message that was displayed
         """
         # Create message label if it doesn't exist
-        if not hasattr(self, 'message_label'):
+        if self.message_label is None:
             self.message_label = ctk.CTkLabel(
                 self.order_frame,
                 text="",
-                font=ctk.CTkFont(size=12)
+                font=get_font(12)
             )
             self.message_label.pack(fill="x", padx=10, pady=5)
             
@@ -916,6 +1370,12 @@ class AssetDetailFrame(ctk.CTkFrame):
         self.message_label.configure(text=message)
         self.message_label.pack(fill="x", padx=10, pady=5)
         
+        # A new message replaces any pending clear of the previous one
+        if clear_after is None:
+            self._cancel_message_clear()
+        else:
+            self._clear_message_later(clear_after)
+        
         return message
     
     def get_message(self) -> str:
@@ -925,13 +1385,30 @@ class AssetDetailFrame(ctk.CTkFrame):
         Returns:
             Current message text
         """
-        if hasattr(self, 'message_label'):
+        if self.message_label is not None:
             return self.message_label.cget("text")
         return ""
     
+    def _clear_message_later(self, delay: int):
+        """
+        Clear the message after a delay, replacing any pending clear.
+        
+        Args:
+            delay: Milliseconds until the message is cleared
+        """
+        self._cancel_message_clear()
+        self._clear_after_id = self.after(delay, self._clear_message)
+    
+    def _cancel_message_clear(self):
+        """Cancel the pending clear of the message, if any."""
+        if self._clear_after_id is not None:
+            self.after_cancel(self._clear_after_id)
+            self._clear_after_id = None
+    
     def _clear_message(self):
         """Clear the message in the UI."""
-        if hasattr(self, 'message_label'):
+        self._cancel_message_clear()
+        if self.message_label is not None:
             self.message_label.configure(text="")
             self.message_label.pack_forget()
     
@@ -949,7 +1426,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         # Create dialog
         dialog = ctk.CTkToplevel(self)
         dialog.title("Symbol Mapping")
-        dialog.geometry("500x500")
+        self._center_dialog(dialog, 500, 500)
         dialog.resizable(False, False)
         
         # Make dialog modal
@@ -964,7 +1441,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             main_frame,
             text=f"Symbol Mapping for {self.symbol}",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -992,56 +1469,15 @@ class AssetDetailFrame(ctk.CTkFrame):
         list_frame = ctk.CTkFrame(main_frame)
         list_frame.pack(fill="both", expand=True, pady=(0, 20))
         
-        # Create scrollable frame for trading pairs
-        pairs_frame = ctk.CTkScrollableFrame(list_frame, width=450, height=200)
-        pairs_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Get all trading pairs
-        trading_pairs = self._api_client.get_all_trading_pairs()
-        
         # Filter by base asset if possible
-        base_asset = self.symbol[-4:] if self.symbol[-4:] in ['USDT', 'USDC', 'BUSD'] else self.symbol[-3:]
-        quote_asset = self.symbol[:-len(base_asset)]
-        
-        # Try to find pairs with the same quote asset
-        relevant_pairs = [pair for pair in trading_pairs if quote_asset in pair]
-        
-        # If no relevant pairs found, show all pairs
-        if not relevant_pairs:
-            relevant_pairs = trading_pairs
+        quote_asset, base_asset = split_symbol(self.symbol)
         
-        # Sort pairs by relevance
-        relevant_pairs.sort(key=lambda x: (0 if quote_asset in x else 1, x))
+        # Get the pairs with the same quote asset, sorted (all pairs if none match)
+        relevant_pairs = self._get_trading_pairs(quote_asset)
         
-        # Create radio buttons for trading pairs
+        # Create list of trading pairs
         pair_var = ctk.StringVar(value="")
-        pair_buttons = []
-        
-        def update_pairs(*args):
-            search_text = search_var.get().upper()
-            
-            # Hide all buttons
-            for button in pair_buttons:
-                button.pack_forget()
-            
-            # Show matching buttons
-            for button in pair_buttons:
-                if search_text in button.cget("text"):
-                    button.pack(anchor="w", padx=10, pady=2)
-        
-        # Create radio buttons
-        for pair in relevant_pairs:
-            radio = ctk.CTkRadioButton(
-                pairs_frame,
-                text=pair,
-                variable=pair_var,
-                value=pair
-            )
-            radio.pack(anchor="w", padx=10, pady=2)
-            pair_buttons.append(radio)
-        
-        # Bind search entry to update pairs
-        search_var.trace_add("write", update_pairs)
+        self._create_pair_list(list_frame, relevant_pairs, pair_var, search_var)
         
         # Manual price option
         manual_price_frame = ctk.CTkFrame(main_frame)
@@ -1086,14 +1522,13 @@ class AssetDetailFrame(ctk.CTkFrame):
                 # If manual price is entered, validate it
                 manual_price = None
                 if manual_price_str:
-                    try:
-                        manual_price = float(manual_price_str)
-                        if manual_price <= 0:
-                            error_label.configure(text="Price must be greater than zero")
-                            return
-                    except ValueError:
+                    manual_price = _parse_float(manual_price_str)
+                    if manual_price is None:
                         error_label.configure(text="Price must be a number")
                         return
+                    if manual_price <= 0:
+                        error_label.configure(text="Price must be greater than zero")
+                        return
                 
                 # If a pair is selected, add symbol mapping
                 if selected_pair:
@@ -1106,8 +1541,7 @@ class AssetDetailFrame(ctk.CTkFrame):
                     self._update_metrics(metrics)
                     
                     # Show success message
-                    self._show_message(f"Using {selected_pair} for {self.symbol}")
-                    self.after(2000, lambda: self._clear_message())
+                    self._show_message(f"Using {selected_pair} for {self.symbol}", clear_after=2000)
                 else:
                     # Calculate with manual price
                     metrics = self._api_client.calculate_position_metrics(
@@ -1120,8 +1554,7 @@ class AssetDetailFrame(ctk.CTkFrame):
                     self._update_metrics(metrics)
                     
                     # Show success message
-                    self._show_message(f"Using manual price: {format_currency(manual_price)}")
-                    self.after(2000, lambda: self._clear_message())
+                    self._show_message(f"Using manual price: {format_currency(manual_price)}", clear_after=2000)
                 
                 # Close dialog
                 dialog.destroy()
@@ -1136,17 +1569,120 @@ class AssetDetailFrame(ctk.CTkFrame):
         )
         save_button.pack(side="right", padx=10, pady=10, expand=True)
         
-        # Center dialog
-        dialog.update_idletasks()
-        width = dialog.winfo_width()
-        height = dialog.winfo_height()
-        x = self.winfo_toplevel().winfo_rootx() + (self.winfo_toplevel().winfo_width() // 2) - (width // 2)
-        y = self.winfo_toplevel().winfo_rooty() + (self.winfo_toplevel().winfo_height() // 2) - (height // 2)
-        dialog.geometry(f"{width}x{height}+{x}+{y}")
         
         # Set focus to search entry
         search_entry.focus_set()
     
+    def _get_trading_pairs(self, asset: str):
+        """
+        Get the sorted trading pairs containing an asset, cached for a few minutes.
+        
+        Args:
+            asset: Asset code (e.g. 'BTC')
+            
+        Returns:
+            Sorted pairs containing the asset, or all pairs sorted if none
+            contain it; the list is shared and must not be modified
+        """
+        now = time.monotonic()
+        if self._pairs_cache is None or now - self._pairs_cache[0] >= self._pairs_ttl:
+            pairs = self._api_client.get_all_trading_pairs()
+            
+            # Don't cache a failed (empty) fetch
+            if not pairs:
+                return []
+            self._pairs_cache = (now, pairs, {})
+        
+        _, pairs, by_asset = self._pairs_cache
+        if asset not in by_asset:
+            # The filter already partitions by relevance, so one plain sort is enough
+            by_asset[asset] = sorted([pair for pair in pairs if asset in pair] or pairs)
+        return by_asset[asset]
+    
+    def _create_pair_list(self, parent, pairs: List[str], pair_var: ctk.StringVar,
+                          search_var: ctk.StringVar) -> tk.Listbox:
+        """
+        Create a searchable single-selection list of trading pairs.
+        
+        A single Listbox is used instead of one widget per pair, so the
+        dialog opens quickly even with thousands of pairs.
+        
+        Args:
+            parent: Parent widget
+            pairs: Trading pairs to list
+            pair_var: Variable that receives the selected pair
+            search_var: Search text; the list shows pairs containing it
+            
+        Returns:
+            The listbox
+        """
+        dark = ctk.get_appearance_mode() == "Dark"
+        listbox = tk.Listbox(
+            parent,
+            selectmode="browse",
+            exportselection=False,
+            height=10,
+            activestyle="none",
+            borderwidth=0,
+            highlightthickness=0,
+            bg="#2B2B2B" if dark else "#F9F9FA",
+            fg="#DCE4EE" if dark else "#1A1A1A",
+            selectbackground="#1F6AA5",
+            selectforeground="#FFFFFF"
+        )
+        scrollbar = ctk.CTkScrollbar(parent, command=listbox.yview)
+        listbox.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y", pady=10)
+        listbox.pack(side="left", fill="both", expand=True, padx=10, pady=10)
+        
+        shown = list(pairs)
+        last_search = ""
+        pending = None
+        
+        def select_current():
+            # Highlight the selected pair if it is shown
+            selected = pair_var.get()
+            if selected in shown:
+                index = shown.index(selected)
+                listbox.selection_set(index)
+                listbox.see(index)
+        
+        def on_select(event):
+            selection = listbox.curselection()
+            if selection:
+                pair_var.set(shown[selection[0]])
+        
+        def update_pairs():
+            nonlocal shown, last_search, pending
+            pending = None
+            search_text = search_var.get().upper()
+            if search_text == last_search:
+                return
+            last_search = search_text
+            
+            # Replace the list contents in one call
+            shown = [pair for pair in pairs if search_text in pair.upper()]
+            listbox.delete(0, "end")
+            if shown:
+                listbox.insert("end", *shown)
+            select_current()
+        
+        def schedule_update(*args):
+            # Collapse a burst of keystrokes into a single filter pass
+            nonlocal pending
+            if pending is not None:
+                listbox.after_cancel(pending)
+            pending = listbox.after(50, update_pairs)
+        
+        if shown:
+            listbox.insert("end", *shown)
+        select_current()
+        
+        listbox.bind("<<ListboxSelect>>", on_select)
+        search_var.trace_add("write", schedule_update)
+        
+        return listbox
+    
     def _prompt_manual_price(self, selected_order_ids: List[int]):
         """
         Prompt user to enter current price manually for invalid symbols.
@@ -1157,7 +1693,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         # Create dialog
         dialog = ctk.CTkToplevel(self)
         dialog.title("Manual Price Entry")
-        dialog.geometry("400x250")
+        self._center_dialog(dialog, 400, 250)
         dialog.resizable(False, False)
         
         # Make dialog modal
@@ -1172,7 +1708,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             main_frame,
             text=f"Manual Price Entry for {self.symbol}",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -1225,9 +1761,8 @@ class AssetDetailFrame(ctk.CTkFrame):
                     error_label.configure(text="Price is required")
                     return
                     
-                try:
-                    price = float(price_str)
-                except ValueError:
+                price = _parse_float(price_str)
+                if price is None:
                     error_label.configure(text="Price must be a number")
                     return
                 
@@ -1251,8 +1786,7 @@ class AssetDetailFrame(ctk.CTkFrame):
                     dialog.destroy()
                     
                     # Show success message
-                    self._show_message(f"Calculated with manual price: {format_currency(price)}")
-                    self.after(2000, lambda: self._clear_message())
+                    self._show_message(f"Calculated with manual price: {format_currency(price)}", clear_after=2000)
                 else:
                     error_label.configure(text="API client not available")
             except Exception as e:
@@ -1265,13 +1799,6 @@ class AssetDetailFrame(ctk.CTkFrame):
         )
         calculate_button.pack(side="right", padx=10, pady=10, expand=True)
         
-        # Center dialog
-        dialog.update_idletasks()
-        width = dialog.winfo_width()
-        height = dialog.winfo_height()
-        x = self.winfo_toplevel().winfo_rootx() + (self.winfo_toplevel().winfo_width() // 2) - (width // 2)
-        y = self.winfo_toplevel().winfo_rooty() + (self.winfo_toplevel().winfo_height() // 2) - (height // 2)
-        dialog.geometry(f"{width}x{height}+{x}+{y}")
     
     def _change_trading_pair(self):
         """Open dialog to select a different trading pair for the same asset."""
@@ -1279,13 +1806,12 @@ class AssetDetailFrame(ctk.CTkFrame):
             return
             
         # Extract base and quote assets
-        base_asset = self.symbol[-4:] if self.symbol[-4:] in ['USDT', 'USDC', 'BUSD', 'USDK'] else self.symbol[-3:]
-        quote_asset = self.symbol[:-len(base_asset)]
+        quote_asset, base_asset = split_symbol(self.symbol)
         
         # Create dialog
         dialog = ctk.CTkToplevel(self)
         dialog.title("Change Trading Pair")
-        dialog.geometry("500x500")
+        self._center_dialog(dialog, 500, 500)
         dialog.resizable(False, False)
         
         # Make dialog modal
@@ -1300,7 +1826,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             main_frame,
             text=f"Select Trading Pair for {quote_asset}",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -1328,58 +1854,12 @@ class AssetDetailFrame(ctk.CTkFrame):
         list_frame = ctk.CTkFrame(main_frame)
         list_frame.pack(fill="both", expand=True, pady=(0, 20))
         
-        # Create scrollable frame for trading pairs
-        pairs_frame = ctk.CTkScrollableFrame(list_frame, width=450, height=200)
-        pairs_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Get all trading pairs
-        trading_pairs = self._api_client.get_all_trading_pairs()
-        
-        # Filter by quote asset
-        relevant_pairs = [pair for pair in trading_pairs if quote_asset in pair]
-        
-        # Add BTC pairs if not already included
-        btc_pairs = [pair for pair in trading_pairs if pair.endswith('BTC') and quote_asset in pair]
-        for pair in btc_pairs:
-            if pair not in relevant_pairs:
-                relevant_pairs.append(pair)
-        
-        # If no relevant pairs found, show all pairs
-        if not relevant_pairs:
-            relevant_pairs = trading_pairs
+        # Get the pairs for this asset, sorted (all pairs if none match)
+        relevant_pairs = self._get_trading_pairs(quote_asset)
         
-        # Sort pairs by relevance
-        relevant_pairs.sort(key=lambda x: (0 if quote_asset in x else 1, x))
-        
-        # Create radio buttons for trading pairs
+        # Create list of trading pairs
         pair_var = ctk.StringVar(value=self.symbol)
-        pair_buttons = []
-        
-        def update_pairs(*args):
-            search_text = search_var.get().upper()
-            
-            # Hide all buttons
-            for button in pair_buttons:
-                button.pack_forget()
-            
-            # Show matching buttons
-            for button in pair_buttons:
-                if search_text in button.cget("text"):
-                    button.pack(anchor="w", padx=10, pady=2)
-        
-        # Create radio buttons
-        for pair in relevant_pairs:
-            radio = ctk.CTkRadioButton(
-                pairs_frame,
-                text=pair,
-                variable=pair_var,
-                value=pair
-            )
-            radio.pack(anchor="w", padx=10, pady=2)
-            pair_buttons.append(radio)
-        
-        # Bind search entry to update pairs
-        search_var.trace_add("write", update_pairs)
+        self._create_pair_list(list_frame, relevant_pairs, pair_var, search_var)
         
         # Error label
         error_label = ctk.CTkLabel(
@@ -1419,8 +1899,7 @@ class AssetDetailFrame(ctk.CTkFrame):
                 # Save as preferred pair
                 if self._api_client:
                     # Extract base and quote assets from the selected pair
-                    base_asset = selected_pair[-4:] if selected_pair[-4:] in ['USDT', 'USDC', 'BUSD', 'USDK'] else selected_pair[-3:]
-                    quote_asset = selected_pair[:-len(base_asset)]
+                    quote_asset, base_asset = split_symbol(selected_pair)
                     
                     # Save preference
                     self._api_client.set_preferred_pair(quote_asset, selected_pair)
@@ -1430,8 +1909,7 @@ class AssetDetailFrame(ctk.CTkFrame):
                     main_window._update_asset(selected_pair)
                     
                     # Show success message
-                    self._show_message(f"Switched to {quote_asset}/{base_asset} and set as preferred pair")
-                    self.after(2000, lambda: self._clear_message())
+                    self._show_message(f"Switched to {quote_asset}/{base_asset} and set as preferred pair", clear_after=2000)
                     
                     # Close dialog
                     dialog.destroy()
@@ -1447,13 +1925,6 @@ class AssetDetailFrame(ctk.CTkFrame):
         )
         switch_button.pack(side="right", padx=10, pady=10, expand=True)
         
-        # Center dialog
-        dialog.update_idletasks()
-        width = dialog.winfo_width()
-        height = dialog.winfo_height()
-        x = self.winfo_toplevel().winfo_rootx() + (self.winfo_toplevel().winfo_width() // 2) - (width // 2)
-        y = self.winfo_toplevel().winfo_rooty() + (self.winfo_toplevel().winfo_height() // 2) - (height // 2)
-        dialog.geometry(f"{width}x{height}+{x}+{y}")
         
         # Set focus to search entry
         search_entry.focus_set()
@@ -1470,13 +1941,35 @@ class AssetDetailFrame(ctk.CTkFrame):
             return
             
         # Extract base and quote assets
-        base_asset = self.symbol[-4:] if self.symbol[-4:] in ['USDT', 'USDC', 'BUSD', 'USDK'] else self.symbol[-3:]
-        quote_asset = self.symbol[:-len(base_asset)]
+        quote_asset, base_asset = split_symbol(self.symbol)
+        title = f"Set Price Alert for {quote_asset}/{base_asset}"
+        current_price_text = f"Current Price: {format_currency(current_price)}"
+        
+        # Reuse the dialog from a previous call
+        fields = self._reuse_dialog("price_alert", 400, 400)
+        if fields is not None:
+            (state, title_label, current_price_label, alert_type_var, price_entry,
+             sound_var, popup_var, error_label) = fields
+            
+            # Reset fields for the current symbol and price
+            state['current_price'] = current_price
+            title_label.configure(text=title)
+            current_price_label.configure(text=current_price_text)
+            alert_type_var.set("above")
+            price_entry.delete(0, "end")
+            price_entry.insert(0, str(current_price))
+            sound_var.set(True)
+            popup_var.set(True)
+            error_label.configure(text="")
+            return
+        
+        # Price the alert is checked against, updated on reuse
+        state = {'current_price': current_price}
         
         # Create dialog
         dialog = ctk.CTkToplevel(self)
         dialog.title("Set Price Alert")
-        dialog.geometry("400x400")
+        self._center_dialog(dialog, 400, 400)
         dialog.resizable(False, False)
         
         # Make dialog modal
@@ -1490,8 +1983,8 @@ class AssetDetailFrame(ctk.CTkFrame):
         # Create title
         title_label = ctk.CTkLabel(
             main_frame,
-            text=f"Set Price Alert for {quote_asset}/{base_asset}",
-            font=ctk.CTkFont(size=16, weight="bold")
+            text=title,
+            font=get_font(16, "bold")
         )
         title_label.pack(pady=(0, 20))
         
@@ -1501,7 +1994,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         
         current_price_label = ctk.CTkLabel(
             current_price_frame,
-            text=f"Current Price: {format_currency(current_price)}"
+            text=current_price_text
         )
         current_price_label.pack(pady=10)
         
@@ -1543,7 +2036,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self.metrics_frame,
             text="",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         self.title_label.grid(row=0, column=0, columnspan=4, sticky="w", padx=10, pady=(10, 5))
         
@@ -1551,7 +2044,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         self.title_label = ctk.CTkLabel(
             self.metrics_frame,
             text="",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         self.title_label.grid(row=0, column=0, columnspan=4, sticky="w", padx=10, pady=(10, 5))
         
@@ -1597,7 +2090,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         cancel_button = ctk.CTkButton(
             button_frame,
             text="Cancel",
-            command=dialog.destroy
+            command=lambda: self._hide_dialog("price_alert")
         )
         cancel_button.pack(side="left", padx=10, pady=10, expand=True)
         
@@ -1615,9 +2108,8 @@ class AssetDetailFrame(ctk.CTkFrame):
                     error_label.configure(text="Price is required")
                     return
                     
-                try:
-                    price = float(price_str)
-                except ValueError:
+                price = _parse_float(price_str)
+                if price is None:
                     error_label.configure(text="Price must be a number")
                     return
                 
@@ -1626,6 +2118,7 @@ class AssetDetailFrame(ctk.CTkFrame):
                     return
                 
                 # Validate alert makes sense
+                current_price = state['current_price']
                 if alert_type == "above" and price <= current_price:
                     error_label.configure(text="Alert price must be above current price")
                     return
@@ -1645,21 +2138,18 @@ class AssetDetailFrame(ctk.CTkFrame):
                     'created_at': time.time()
                 }
                 
-                # Store alert
-                if not hasattr(self, 'price_alerts'):
-                    self.price_alerts = []
-                    
-                self.price_alerts.append(alert)
-                
-                # Start alert checking if not already running
-                self._start_alert_checking()
+                # Store alert (checked on the next price update)
+                buckets = self.price_alerts.setdefault(self.symbol, {'above': ([], []), 'below': ([], [])})
+                prices, alerts = buckets[alert_type]
+                index = bisect.bisect_right(prices, price)
+                prices.insert(index, price)
+                alerts.insert(index, alert)
                 
                 # Close dialog
-                dialog.destroy()
+                self._hide_dialog("price_alert")
                 
                 # Show success message
-                self._show_message(f"Price alert set: {alert_type} {format_currency(price)}")
-                self.after(2000, lambda: self._clear_message())
+                self._show_message(f"Price alert set: {alert_type} {format_currency(price)}", clear_after=2000)
                 
             except Exception as e:
                 error_label.configure(text=f"Error: {str(e)}")
@@ -1671,49 +2161,45 @@ class AssetDetailFrame(ctk.CTkFrame):
         )
         set_button.pack(side="right", padx=10, pady=10, expand=True)
         
-        # Center dialog
-        dialog.update_idletasks()
-        width = dialog.winfo_width()
-        height = dialog.winfo_height()
-        x = self.winfo_toplevel().winfo_rootx() + (self.winfo_toplevel().winfo_width() // 2) - (width // 2)
-        y = self.winfo_toplevel().winfo_rooty() + (self.winfo_toplevel().winfo_height() // 2) - (height // 2)
-        dialog.geometry(f"{width}x{height}+{x}+{y}")
+        # Keep the dialog for reuse
+        self._keep_dialog("price_alert", dialog, (state, title_label, current_price_label, alert_type_var,
+                                                  price_entry, sound_var, popup_var, error_label))
+        
     
-    def _start_alert_checking(self):
-        """Start checking for price alerts."""
-        if hasattr(self, '_alert_checking') and self._alert_checking:
-            return  # Already running
-            
-        self._alert_checking = True
-        
-        def check_alerts():
-            while hasattr(self, '_alert_checking') and self._alert_checking:
-                try:
-                    if hasattr(self, 'price_alerts') and self.price_alerts and self.symbol:
-                        current_price = self.metrics.get('current_price', 0)
-                        if current_price > 0:
-                            # Check each alert
-                            triggered_alerts = []
-                            for alert in self.price_alerts:
-                                if alert['symbol'] == self.symbol:
-                                    if alert['type'] == 'above' and current_price >= alert['price']:
-                                        triggered_alerts.append(alert)
-                                    elif alert['type'] == 'below' and current_price <= alert['price']:
-                                        triggered_alerts.append(alert)
-                            
-                            # Handle triggered alerts
-                            for alert in triggered_alerts:
-                                self._trigger_alert(alert, current_price)
-                                self.price_alerts.remove(alert)
-                                
-                except Exception as e:
-                    print(f"Error checking alerts: {e}")
-                    
-                # Sleep for 1 second
-                time.sleep(1)
+    def _check_price_alerts(self, current_price: float):
+        """
+        Trigger and remove the alerts for the current symbol that a new price reaches.
         
-        # Start checking thread
-        threading.Thread(target=check_alerts, daemon=True).start()
+        Args:
+            current_price: Latest price of the current symbol
+        """
+        buckets = self.price_alerts.get(self.symbol)
+        if not buckets or current_price <= 0:
+            return
+        
+        try:
+            # "Above" alerts at or below the price and "below" alerts at or
+            # above it are contiguous runs of their sorted lists
+            above_prices, above_alerts = buckets['above']
+            below_prices, below_alerts = buckets['below']
+            above_end = bisect.bisect_right(above_prices, current_price)
+            below_start = bisect.bisect_left(below_prices, current_price)
+            triggered_alerts = above_alerts[:above_end] + below_alerts[below_start:]
+            if not triggered_alerts:
+                return
+            
+            # Remove triggered alerts
+            del above_prices[:above_end], above_alerts[:above_end]
+            del below_prices[below_start:], below_alerts[below_start:]
+            if not above_prices and not below_prices:
+                del self.price_alerts[self.symbol]
+            
+            # Handle triggered alerts
+            for alert in triggered_alerts:
+                self._trigger_alert(alert, current_price)
+                
+        except Exception as e:
+            print(f"Error checking alerts: {e}")
     
     def _trigger_alert(self, alert: Dict, current_price: float):
         """
@@ -1731,8 +2217,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         show_popup = alert.get('popup', True)
         
         # Extract base and quote assets
-        base_asset = symbol[-4:] if symbol[-4:] in ['USDT', 'USDC', 'BUSD', 'USDK'] else symbol[-3:]
-        quote_asset = symbol[:-len(base_asset)]
+        quote_asset, base_asset = split_symbol(symbol)
         
         # Create message
         message = f"PRICE ALERT: {quote_asset}/{base_asset}\n"
@@ -1742,13 +2227,13 @@ class AssetDetailFrame(ctk.CTkFrame):
             message += f"Price has dropped below {format_currency(alert_price)}\n"
         message += f"Current price: {format_currency(current_price)}"
         
-        # Show popup
+        # Show popup (alerts are checked on the UI thread, so no after() hop is needed)
         if show_popup:
-            self.after(0, lambda: self._show_alert_popup(message))
+            self._show_alert_popup(message)
         
         # Play sound
         if play_sound:
-            self.after(0, lambda: self._play_alert_sound())
+            self._play_alert_sound()
     
     def _show_alert_popup(self, message: str):
         """
@@ -1760,7 +2245,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         # Create popup
         popup = ctk.CTkToplevel(self)
         popup.title("Price Alert")
-        popup.geometry("400x200")
+        self._center_dialog(popup, 400, 200)
         popup.resizable(False, False)
         popup.attributes('-topmost', True)  # Keep on top
         
@@ -1772,7 +2257,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         alert_label = ctk.CTkLabel(
             main_frame,
             text="🔔",
-            font=ctk.CTkFont(size=32)
+            font=get_font(32)
         )
         alert_label.pack(pady=(0, 10))
         
@@ -1792,13 +2277,6 @@ class AssetDetailFrame(ctk.CTkFrame):
         )
         close_button.pack(pady=(0, 10))
         
-        # Center popup
-        popup.update_idletasks()
-        width = popup.winfo_width()
-        height = popup.winfo_height()
-        x = self.winfo_toplevel().winfo_rootx() + (self.winfo_toplevel().winfo_width() // 2) - (width // 2)
-        y = self.winfo_toplevel().winfo_rooty() + (self.winfo_toplevel().winfo_height() // 2) - (height // 2)
-        popup.geometry(f"{width}x{height}+{x}+{y}")
         
         # Auto-close after 10 seconds
         popup.after(10000, popup.destroy)
@@ -1806,17 +2284,10 @@ class AssetDetailFrame(ctk.CTkFrame):
     def _play_alert_sound(self):
         """Play alert sound."""
         try:
-            # Try to use winsound on Windows
-            import winsound
-            winsound.Beep(1000, 500)  # 1000 Hz for 500 ms
-        except:
-            try:
-                # Try to use system bell
-                import os
-                os.system('echo -e "\a"')
-            except:
-                # If all else fails, print to console
-                print("\a")  # ASCII bell character
+            _beep()
+        except Exception:
+            # If all else fails, print to console
+            print("\a")  # ASCII bell character
     
     def _toggle_select_all(self):
         """Toggle select/deselect all orders."""
@@ -1829,17 +2300,14 @@ class AssetDetailFrame(ctk.CTkFrame):
         # Update button text
         self.select_all_btn.configure(text="Deselect All" if is_select_all else "Select All")
         
-        # Update order inclusion
-        if self.symbol not in self.include_orders:
-            self.include_orders[self.symbol] = {}
-            
         # Toggle all orders
-        for order in self.orders:
-            order_id = order['orderId']
-            self.include_orders[self.symbol][order_id] = is_select_all
+        if is_select_all:
+            self.include_orders[self.symbol] = set()
+        else:
+            self.include_orders[self.symbol] = {order['orderId'] for order in self.orders}
             
-        # Update order table
-        self.order_table.update_orders(self.orders, self.include_orders.get(self.symbol, {}))
+        # Update order table (keeping the current filter and pages)
+        self._render_page()
         
         # Recalculate metrics if selecting all
         if is_select_all:
@@ -1847,72 +2315,86 @@ class AssetDetailFrame(ctk.CTkFrame):
     
     def _update_open_orders(self):
         """Update open orders display."""
-        if not self.symbol or not self.metrics or not hasattr(self, 'open_orders_content'):
+        metrics = self.metrics
+        if not self.symbol or not metrics:
             return
             
         # Get open orders from metrics
-        open_orders = self.metrics.get('open_orders', [])
+        open_orders = metrics.get('open_orders', [])
         
-        # Clear existing content
-        for widget in self.open_orders_content.winfo_children():
-            widget.destroy()
-            
         # Show "No open orders" if there are none
         if not open_orders:
-            self.no_open_orders_label = ctk.CTkLabel(
-                self.open_orders_content,
-                text="No open orders",
-                font=ctk.CTkFont(size=12)
-            )
-            self.no_open_orders_label.pack(padx=10, pady=10)
+            if self._open_orders_shown:
+                self._open_orders_table.pack_forget()
+                self.no_open_orders_label.pack(padx=10, pady=10)
+                self._open_orders_shown = 0
             return
             
         # Extract base and quote assets
-        base_asset = self.symbol[-4:] if self.symbol[-4:] in ['USDT', 'USDC', 'BUSD'] else self.symbol[-3:]
-        quote_asset = self.symbol[:-len(base_asset)]
+        quote_asset, base_asset = split_symbol(self.symbol)
         
-        # Create a table for open orders
-        order_table = ctk.CTkFrame(self.open_orders_content)
-        order_table.pack(fill="x", padx=10, pady=5)
-        
-        # Configure grid
-        order_table.grid_columnconfigure(0, weight=1)  # Side
-        order_table.grid_columnconfigure(1, weight=1)  # Price
-        order_table.grid_columnconfigure(2, weight=1)  # Amount
-        order_table.grid_columnconfigure(3, weight=1)  # Total
-        
-        # Create header
-        ctk.CTkLabel(order_table, text="Side", font=ctk.CTkFont(weight="bold")).grid(row=0, column=0, padx=5, pady=5)
-        ctk.CTkLabel(order_table, text="Price", font=ctk.CTkFont(weight="bold")).grid(row=0, column=1, padx=5, pady=5)
-        ctk.CTkLabel(order_table, text="Amount", font=ctk.CTkFont(weight="bold")).grid(row=0, column=2, padx=5, pady=5)
-        ctk.CTkLabel(order_table, text="Total", font=ctk.CTkFont(weight="bold")).grid(row=0, column=3, padx=5, pady=5)
-        
-        # Add rows for each open order
-        for i, order in enumerate(open_orders):
-            # Side (with color)
-            side = order.get('side', '')
-            side_color = "#4CAF50" if side == "BUY" else "#F44336"
-            side_label = ctk.CTkLabel(order_table, text=side, text_color=side_color)
-            side_label.grid(row=i+1, column=0, padx=5, pady=5)
-            
-            # Price
-            price = float(order.get('price', 0))
-            price_label = ctk.CTkLabel(order_table, text=format_currency(price))
-            price_label.grid(row=i+1, column=1, padx=5, pady=5)
-            
-            # Amount (locked quantity)
-            locked_qty = float(order.get('lockedQty', 0))
-            amount_label = ctk.CTkLabel(
-                order_table,
-                text=f"{format_crypto_amount(locked_qty)} {quote_asset}",
-                text_color="#FFA500"  # Orange color for locked amounts
+        # Create the table for open orders on first use (one Treeview, rows are items)
+        if self._open_orders_table is None:
+            columns = ("side", "price", "amount", "total")
+            order_table = ttk.Treeview(
+                self.open_orders_content,
+                columns=columns,
+                show="headings",
+                height=1,
+                selectmode="none",
+                style="OpenOrders.Treeview"
             )
-            amount_label.grid(row=i+1, column=2, padx=5, pady=5)
+            for column in columns:
+                order_table.heading(column, text=column.capitalize())
+                order_table.column(column, anchor="center", width=100)
             
-            # Total
-            total = price * locked_qty
-            total_label = ctk.CTkLabel(order_table, text=format_currency(total))
-            total_label.grid(row=i+1, column=3, padx=5, pady=5)
+            self._open_orders_table = order_table
+        
+        # Match the table colors to the appearance mode
+        mode = ctk.get_appearance_mode()
+        if mode != self._open_orders_mode:
+            self._open_orders_mode = mode
+            dark = mode == "Dark"
+            bg = "#2B2B2B" if dark else "#F9F9FA"
+            fg = "#DCE4EE" if dark else "#1A1A1A"
+            style = ttk.Style(self)
+            style.configure("OpenOrders.Treeview", background=bg, fieldbackground=bg, foreground=fg,
+                            borderwidth=0, rowheight=26)
+            style.configure("OpenOrders.Treeview.Heading", font=("", 12, "bold"))
+            self._open_orders_table.tag_configure("BUY", foreground="#4CAF50")
+            self._open_orders_table.tag_configure("SELL", foreground="#F44336")
+        
+        # Swap the "No open orders" label for the table
+        if not self._open_orders_shown:
+            self.no_open_orders_label.pack_forget()
+            self._open_orders_table.pack(fill="x", padx=10, pady=5)
+        
+        # Parse and format each open orders list once, not on every redraw
+        last = self._open_order_key
+        if last is None or last[0] is not open_orders or last[1] != quote_asset:
+            self._open_order_key = (open_orders, quote_asset)
+            fc = format_currency
+            fa = format_crypto_amount
+            views = [_OrderView.from_open_order(order) for order in open_orders]
+            values = [
+                (view.side, fc(view.price), f"{fa(view.qty)} {quote_asset}", fc(view.total))
+                for view in views
+            ]
+            
+            # Update existing items in place, add missing ones and drop leftovers
+            order_table = self._open_orders_table
+            rows = self._open_order_rows
+            for i, (view, row_values) in enumerate(zip(views, values)):
+                if i < len(rows):
+                    order_table.item(rows[i], values=row_values, tags=(view.side,))
+                else:
+                    rows.append(order_table.insert("", "end", values=row_values, tags=(view.side,)))
+            if len(rows) > len(views):
+                order_table.delete(*rows[len(views):])
+                del rows[len(views):]
+            order_table.configure(height=len(views))
+        
+        self._open_orders_shown = len(open_orders)
     
     def _update_metrics(self, metrics: Dict):
         """
@@ -1923,6 +2405,7 @@ class AssetDetailFrame(ctk.CTkFrame):
         """
         self.metrics = metrics
         self._update_ui()
+        self._check_price_alerts(metrics.get('current_price', 0))
 
 
 class OrderTable(ctk.CTkScrollableFrame):
@@ -1947,14 +2430,19 @@ class OrderTable(ctk.CTkScrollableFrame):
         # Create header
         self._create_header()
         
-        # Store order rows
+        # Store order rows (order ID -> row) and the IDs in display order
         self.order_rows = {}
+        self._row_ids = []
+        
+        # What the rows currently show, to skip updates that change nothing
+        self._last_fingerprint = None
     
     def _create_header(self):
         """Create table header."""
         # Create header frame
         header = ctk.CTkFrame(self)
         header.pack(fill="x", pady=(0, 5))
+        self._header = header
         
         # Configure grid
         header.grid_columnconfigure(0, weight=0)  # Include checkbox
@@ -1967,41 +2455,84 @@ class OrderTable(ctk.CTkScrollableFrame):
         
         # Create header labels
         ctk.CTkLabel(header, text="", width=30).grid(row=0, column=0, padx=5, pady=5)
-        ctk.CTkLabel(header, text="Date", font=ctk.CTkFont(weight="bold")).grid(row=0, column=1, padx=5, pady=5)
-        ctk.CTkLabel(header, text="Side", font=ctk.CTkFont(weight="bold")).grid(row=0, column=2, padx=5, pady=5)
-        ctk.CTkLabel(header, text="Price", font=ctk.CTkFont(weight="bold")).grid(row=0, column=3, padx=5, pady=5)
-        ctk.CTkLabel(header, text="Amount", font=ctk.CTkFont(weight="bold")).grid(row=0, column=4, padx=5, pady=5)
-        ctk.CTkLabel(header, text="Total", font=ctk.CTkFont(weight="bold")).grid(row=0, column=5, padx=5, pady=5)
-        ctk.CTkLabel(header, text="Actions", font=ctk.CTkFont(weight="bold")).grid(row=0, column=6, padx=5, pady=5)
+        ctk.CTkLabel(header, text="Date", font=get_font(weight="bold")).grid(row=0, column=1, padx=5, pady=5)
+        ctk.CTkLabel(header, text="Side", font=get_font(weight="bold")).grid(row=0, column=2, padx=5, pady=5)
+        ctk.CTkLabel(header, text="Price", font=get_font(weight="bold")).grid(row=0, column=3, padx=5, pady=5)
+        ctk.CTkLabel(header, text="Amount", font=get_font(weight="bold")).grid(row=0, column=4, padx=5, pady=5)
+        ctk.CTkLabel(header, text="Total", font=get_font(weight="bold")).grid(row=0, column=5, padx=5, pady=5)
+        ctk.CTkLabel(header, text="Actions", font=get_font(weight="bold")).grid(row=0, column=6, padx=5, pady=5)
     
-    def update_orders(self, orders: List[Dict], include_orders: Dict[int, bool]):
+    def update_orders(self, orders: List[Dict], excluded_ids: Set[int]):
         """
         Update order table with new orders.
         
         Args:
             orders: List of order dictionaries
-            include_orders: Dictionary of order inclusion status
+            excluded_ids: IDs of orders excluded from calculations
         """
-        # Clear existing rows
-        for row in self.order_rows.values():
-            row.destroy()
-        self.order_rows = {}
+        # Nothing to do if the same orders would be shown the same way
+        fingerprint = tuple(
+            (order['orderId'], order['orderId'] not in excluded_ids,
+             order.get('executedQty', 0), order.get('avgPrice', 0), order.get('cummulativeQuoteQty', 0))
+            for order in orders
+        )
+        if fingerprint == self._last_fingerprint:
+            return
         
-        # Add new rows
-        for i, order in enumerate(orders):
+        new_ids = [order['orderId'] for order in orders]
+        new_id_set = set(new_ids)
+        
+        # Destroy only the rows whose orders are gone
+        for order_id in self._row_ids:
+            if order_id not in new_id_set:
+                self.order_rows.pop(order_id).destroy()
+        
+        # Kept rows stay in their slots unless the order changed
+        kept_ids = [order_id for order_id in self._row_ids if order_id in new_id_set]
+        in_place = kept_ids == [order_id for order_id in new_ids if order_id in self.order_rows]
+        
+        previous = self._header
+        for order in orders:
             order_id = order['orderId']
-            include = include_orders.get(order_id, True)
+            include = order_id not in excluded_ids
+            row = self.order_rows.get(order_id)
             
-            # Create row
-            row = OrderRow(
-                self,
-                order,
-                include,
-                lambda oid=order_id, inc=include: self.toggle_callback(oid, not inc)
-            )
-            row.pack(fill="x", pady=2)
+            if row is None:
+                # Create row for a new order
+                row = OrderRow(self, order, include, self._make_toggle(order_id))
+                row.pack(fill="x", pady=2, after=previous)
+                self.order_rows[order_id] = row
+            else:
+                # Update the existing row in place
+                row.set_order(order, include)
+                if not in_place:
+                    row.pack(fill="x", pady=2, after=previous)
+            
+            previous = row
+        
+        self._row_ids = new_ids
+        self._last_fingerprint = fingerprint
+    
+    def _make_toggle(self, order_id: int) -> Callable:
+        """
+        Create the include checkbox callback for an order.
+        
+        Args:
+            order_id: Order ID
+            
+        Returns:
+            Callback passing the checkbox state to toggle_callback
+        """
+        def toggle():
+            row = self.order_rows[order_id]
+            include = row.include_var.get()
             
-            self.order_rows[order_id] = row
+            # Keep the row's cached state in step with the checkbox; the rows
+            # no longer match the last fingerprint
+            row.include = include
+            self._last_fingerprint = None
+            self.toggle_callback(order_id, include)
+        return toggle
 
 
 class OrderRow(ctk.CTkFrame):
@@ -2060,42 +2591,71 @@ class OrderRow(ctk.CTkFrame):
         self.original_symbol = ""
         
         # Date
-        date_label = ctk.CTkLabel(self, text=self.order.get('time', ''))
-        date_label.grid(row=0, column=1, padx=5, pady=5)
+        self.date_label = ctk.CTkLabel(self, text="")
+        self.date_label.grid(row=0, column=1, padx=5, pady=5)
         
         # Side (with color)
-        side = self.order.get('side', '')
-        side_color = "#4CAF50" if side == "BUY" else "#F44336"
-        side_label = ctk.CTkLabel(self, text=side, text_color=side_color)
-        side_label.grid(row=0, column=2, padx=5, pady=5)
+        self.side_label = ctk.CTkLabel(self, text="")
+        self.side_label.grid(row=0, column=2, padx=5, pady=5)
         
         # Price
-        price = float(self.order.get('avgPrice', 0))
-        price_label = ctk.CTkLabel(self, text=format_currency(price))
-        price_label.grid(row=0, column=3, padx=5, pady=5)
+        self.price_label = ctk.CTkLabel(self, text="")
+        self.price_label.grid(row=0, column=3, padx=5, pady=5)
         
         # Amount
-        amount = float(self.order.get('executedQty', 0))
-        amount_label = ctk.CTkLabel(self, text=format_crypto_amount(amount))
-        amount_label.grid(row=0, column=4, padx=5, pady=5)
+        self.amount_label = ctk.CTkLabel(self, text="")
+        self.amount_label.grid(row=0, column=4, padx=5, pady=5)
         
         # Total
-        total = float(self.order.get('cummulativeQuoteQty', 0))
-        total_label = ctk.CTkLabel(self, text=format_currency(total))
-        total_label.grid(row=0, column=5, padx=5, pady=5)
-        
-        # Delete button (only for manual orders)
-        if self.order.get('isManual', False):
-            delete_button = ctk.CTkButton(
-                self,
-                text="Delete",
-                width=60,
-                height=24,
-                fg_color="#F44336",
-                hover_color="#D32F2F",
-                command=self._delete_order
-            )
-            delete_button.grid(row=0, column=6, padx=5, pady=5)
+        self.total_label = ctk.CTkLabel(self, text="")
+        self.total_label.grid(row=0, column=5, padx=5, pady=5)
+        
+        # Delete button (only for manual orders, created when first needed)
+        self.delete_button = None
+        
+        self._show_order()
+    
+    def set_order(self, order: Dict, include: bool):
+        """
+        Show another order (or the same one) in this row without recreating it.
+        
+        Args:
+            order: Order dictionary
+            include: Whether to include the order in calculations
+        """
+        if include != self.include:
+            self.include = include
+            self.include_var.set(include)
+        if order is not self.order:
+            self.order = order
+            self._show_order()
+    
+    def _show_order(self):
+        """Fill the row widgets from the current order."""
+        view = _OrderView.from_history(self.order)
+        self.date_label.configure(text=view.time)
+        
+        side_color = "#4CAF50" if view.side == "BUY" else "#F44336"
+        self.side_label.configure(text=view.side, text_color=side_color)
+        
+        self.price_label.configure(text=format_currency(view.price))
+        self.amount_label.configure(text=format_crypto_amount(view.qty))
+        self.total_label.configure(text=format_currency(view.total))
+        
+        if view.is_manual:
+            if self.delete_button is None:
+                self.delete_button = ctk.CTkButton(
+                    self,
+                    text="Delete",
+                    width=60,
+                    height=24,
+                    fg_color="#F44336",
+                    hover_color="#D32F2F",
+                    command=self._delete_order
+                )
+            self.delete_button.grid(row=0, column=6, padx=5, pady=5)
+        elif self.delete_button is not None:
+            self.delete_button.grid_remove()
     
     def _delete_order(self):
         """Delete this manual order."""
@@ -2108,7 +2668,7 @@ class OrderRow(ctk.CTkFrame):
         # Confirm deletion
         dialog = ctk.CTkToplevel(self)
         dialog.title("Confirm Deletion")
-        dialog.geometry("400x150")
+        center_on_parent(dialog, self.winfo_toplevel(), 400, 150)
         dialog.resizable(False, False)
         
         # Make dialog modal
@@ -2154,18 +2714,18 @@ class OrderRow(ctk.CTkFrame):
                         order for order in asset_detail.orders
                         if order.get('orderId') != self.order['orderId']
                     ]
+                    asset_detail._order_ts = None
+                    asset_detail._metrics_cache.clear()
                 
                 # Remove from include_orders
                 if hasattr(asset_detail, 'include_orders') and self.order['symbol'] in asset_detail.include_orders:
-                    if self.order['orderId'] in asset_detail.include_orders[self.order['symbol']]:
-                        del asset_detail.include_orders[self.order['symbol']][self.order['orderId']]
+                    asset_detail.include_orders[self.order['symbol']].discard(self.order['orderId'])
                 
                 # Update order table
-                order_table.update_orders(asset_detail.orders, asset_detail.include_orders.get(self.order['symbol'], {}))
+                asset_detail._show_orders(asset_detail.orders)
                 
                 # Show success message
-                asset_detail._show_message("Manual order deleted successfully")
-                asset_detail.after(2000, lambda: asset_detail._clear_message())
+                asset_detail._show_message("Manual order deleted successfully", clear_after=2000)
                 
                 # Close dialog
                 dialog.destroy()
@@ -2186,12 +2746,4 @@ class OrderRow(ctk.CTkFrame):
             hover_color="#D32F2F",
             command=confirm_delete
         )
-        delete_button.pack(side="right", padx=10, pady=10, expand=True)
-        
-        # Center dialog
-        dialog.update_idletasks()
-        width = dialog.winfo_width()
-        height = dialog.winfo_height()
-        x = self.winfo_toplevel().winfo_rootx() + (self.winfo_toplevel().winfo_width() // 2) - (width // 2)
-        y = self.winfo_toplevel().winfo_rooty() + (self.winfo_toplevel().winfo_height() // 2) - (height // 2)
-        dialog.geometry(f"{width}x{height}+{x}+{y}")
\ No newline at end of file
+        delete_button.pack(side="right", padx=10, pady=10, expand=True)
\ No newline at end of file
@@ -1,3 +1,21 @@
+    @staticmethod
+    def _fmt8(value: float) -> str:
+        """
+        Format a number with up to 8 decimals and no trailing zeros.
+        
+        Args:
+            value: Number to format
+            
+        Returns:
+            Formatted number (e.g. '0.5', '12')
+        """
+        # Whole numbers need no decimal formatting or stripping
+        if isinstance(value, int):
+            return str(value)
+        if value.is_integer():
+            return str(int(value))
+        return f"{value:.8f}".rstrip('0').rstrip('.')
+    
     def update_orders(self, orders: List[Dict], include_orders: Dict[int, bool]) -> None:
         """
         Update table with order data.
@@ -48,18 +66,18 @@
                     order.get('time', ''),
                     side,
                     original_symbol,
-                    f"{order.get('executedQty', 0):.8f}".rstrip('0').rstrip('.'),
-                    f"{price:.8f}".rstrip('0').rstrip('.'),
-                    f"{total:.8f}".rstrip('0').rstrip('.')
+                    self._fmt8(order.get('executedQty', 0)),
+                    self._fmt8(price),
+                    self._fmt8(total)
                 ]
             else:
                 # Regular view
                 values = [
                     order.get('time', ''),
                     side,
-                    f"{order.get('executedQty', 0):.8f}".rstrip('0').rstrip('.'),
-                    f"{order.get('avgPrice', 0):.8f}".rstrip('0').rstrip('.'),
-                    f"{order.get('cummulativeQuoteQty', 0):.8f}".rstrip('0').rstrip('.')
+                    self._fmt8(order.get('executedQty', 0)),
+                    self._fmt8(order.get('avgPrice', 0)),
+                    self._fmt8(order.get('cummulativeQuoteQty', 0))
                 ]
             
             # Add to table
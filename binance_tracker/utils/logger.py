@@ -1,15 +1,41 @@
 import os
+import atexit
 import logging
+import logging.handlers
 import datetime
+import queue
+import threading
 from typing import Optional
 
 
+class _RawQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that enqueues records unformatted.
+    
+    The stock QueueHandler formats the message and traceback on the calling
+    thread; here the listener's handlers do it instead.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for queuing.
+        
+        Args:
+            record: Log record
+            
+        Returns:
+            The record itself
+        """
+        return record
+
+
 class Logger:
     """
     Logger utility for the application.
     """
     
     _instance = None
+    _lock = threading.Lock()
     
     @classmethod
     def get_instance(cls) -> 'Logger':
@@ -20,7 +46,9 @@ class Logger:
             Logger instance
         """
         if cls._instance is None:
-            cls._instance = Logger()
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = Logger()
         return cls._instance
     
     def __init__(self):
@@ -29,6 +57,10 @@ class Logger:
         self.logger = logging.getLogger("BinanceTracker")
         self.logger.setLevel(logging.DEBUG)
         
+        # Handlers are already attached if the module was loaded before
+        if self.logger.handlers:
+            return
+        
         # Create formatter
         formatter = logging.Formatter(
             "%(asctime)s - %(levelname)s - %(message)s",
@@ -39,7 +71,6 @@ class Logger:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
         
         # Create file handler
         log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
@@ -49,7 +80,20 @@ class Logger:
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        
+        # Callers only enqueue records; a listener thread formats and writes them
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(_RawQueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue,
+            console_handler,
+            file_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        
+        # Flush queued records on shutdown
+        atexit.register(self._listener.stop)
     
     def debug(self, message: str):
         """
@@ -87,7 +131,8 @@ class Logger:
             exc: Optional exception
         """
         if exc:
-            self.logger.error(f"{message}: {str(exc)}", exc_info=True)
+            # Formatted (with the traceback) by the listener thread, not the caller
+            self.logger.error("%s: %s", message, exc, exc_info=exc)
         else:
             self.logger.error(message)
     
@@ -100,7 +145,8 @@ class Logger:
             exc: Optional exception
         """
         if exc:
-            self.logger.critical(f"{message}: {str(exc)}", exc_info=True)
+            # Formatted (with the traceback) by the listener thread, not the caller
+            self.logger.critical("%s: %s", message, exc, exc_info=exc)
         else:
             self.logger.critical(message)
 
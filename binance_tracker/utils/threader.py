@@ -1,18 +1,27 @@
 import os
-import threading
-import queue
-import time
 import importlib.util
-from typing import Callable, Any, Dict, List, Optional, Tuple, Union
+import sys
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 # Get the absolute path of the current script
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
-# Import modules directly using file paths
+# Import modules directly using file paths (each file is loaded once and shared)
 def import_from_file(module_name, file_path):
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    key = f"binance_tracker:{os.path.normcase(os.path.abspath(file_path))}"
+    module = sys.modules.get(key)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[key] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[key]
+            raise
     return module
 
 # Import required modules
@@ -22,130 +31,98 @@ utils_logger = import_from_file("logger", os.path.join(current_dir, "logger.py")
 error = utils_logger.error
 
 
-class ThreadWorker:
-    """
-    Worker for executing tasks in a separate thread.
+def _task_done(callback: Optional[Callable[[bool, Any], None]], future: Future):
     """
+    Log a failed task and pass a finished task's outcome to its callback.
     
-    def __init__(self, name: str = "Worker"):
-        """
-        Initialize thread worker.
-        
-        Args:
-            name: Worker name
-        """
-        self.name = name
-        self.task_queue = queue.Queue()
-        self.results = {}
-        self.running = False
-        self.thread = None
+    Dropped or cancelled tasks are reported as failed with a CancelledError.
     
-    def start(self):
-        """Start the worker thread."""
-        if self.running:
-            return
-            
-        self.running = True
-        self.thread = threading.Thread(target=self._worker_loop, name=self.name)
-        self.thread.daemon = True
-        self.thread.start()
+    Args:
+        callback: Callback taking (success, result or exception), or None
+        future: Finished task future
+    """
+    if future.cancelled():
+        exc = CancelledError()
+    else:
+        exc = future.exception()
+        if exc is not None:
+            error("Error executing task", exc)
+    if callback is None:
+        return
+    try:
+        if exc is None:
+            callback(True, future.result())
+        else:
+            callback(False, exc)
+    except Exception as e:
+        error("Error in task callback", e)
+
+
+class TaskPool:
+    """
+    Pool of worker threads for executing tasks.
+    """
     
-    def stop(self):
-        """Stop the worker thread."""
-        self.running = False
-        
-        if self.thread:
-            self.thread.join(timeout=1.0)
-            self.thread = None
+    __slots__ = ("_executor", "max_pending", "_pending", "_pending_lock")
     
-    def add_task(
-        self,
-        task_id: str,
-        func: Callable,
-        *args,
-        **kwargs
-    ) -> str:
+    def __init__(self, num_workers: int = 4, max_pending: int = 256):
         """
-        Add a task to the queue.
+        Initialize task pool.
         
         Args:
-            task_id: Task identifier
-            func: Function to execute
-            *args: Function arguments
-            **kwargs: Function keyword arguments
-            
-        Returns:
-            Task ID
+            num_workers: Maximum number of worker threads (started on demand)
+            max_pending: Maximum number of unfinished tasks; beyond it the
+                oldest tasks that have not started yet are dropped
         """
-        self.task_queue.put((task_id, func, args, kwargs))
-        return task_id
+        self._executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="Worker")
+        self.max_pending = max_pending
+        
+        # Unfinished tasks in submission order (dict used as an ordered set)
+        self._pending: Dict[Future, None] = {}
+        self._pending_lock = threading.Lock()
     
-    def get_result(self, task_id: str, remove: bool = True) -> Tuple[bool, Any]:
+    def _track(self, submitted: List[Tuple[Future, Optional[Callable[[bool, Any], None]]]]):
         """
-        Get the result of a task.
+        Record submitted tasks, dropping the oldest queued tasks when over the limit.
         
         Args:
-            task_id: Task identifier
-            remove: Whether to remove the result after retrieval
-            
-        Returns:
-            Tuple of (success, result)
+            submitted: (future, callback) for each submitted task; callback may be None
         """
-        if task_id not in self.results:
-            return False, None
+        # Take the lock once for the whole batch
+        with self._pending_lock:
+            pending = self._pending
+            for future, _ in submitted:
+                pending[future] = None
             
-        success, result = self.results[task_id]
+            # Forget the oldest tasks over the limit
+            # (tracker work is repeated, so the latest request is the one that matters)
+            dropped = []
+            while len(pending) > self.max_pending:
+                oldest = next(iter(pending))
+                del pending[oldest]
+                dropped.append(oldest)
         
-        if remove:
-            del self.results[task_id]
-            
-        return success, result
-    
-    def _worker_loop(self):
-        """Worker thread loop."""
-        while self.running:
-            try:
-                # Get task from queue with timeout
-                try:
-                    task_id, func, args, kwargs = self.task_queue.get(timeout=0.5)
-                except queue.Empty:
-                    continue
-                
-                # Execute task
-                try:
-                    result = func(*args, **kwargs)
-                    self.results[task_id] = (True, result)
-                except Exception as e:
-                    error(f"Error executing task {task_id}", e)
-                    self.results[task_id] = (False, str(e))
-                
-                # Mark task as done
-                self.task_queue.task_done()
-            except Exception as e:
-                error(f"Error in worker loop", e)
-
-
-class TaskPool:
-    """
-    Pool of worker threads for executing tasks.
-    """
+        # Report the outcome as soon as each task finishes (at once if it already has)
+        finished = self._finished
+        for future, callback in submitted:
+            future.add_done_callback(partial(finished, callback))
+        
+        # Cancel dropped tasks that have not started; this runs their callbacks,
+        # so it happens outside the lock
+        for oldest in dropped:
+            oldest.cancel()
     
-    def __init__(self, num_workers: int = 4):
+    def _finished(self, callback: Optional[Callable[[bool, Any], None]], future: Future):
         """
-        Initialize task pool.
+        Forget a finished task and report its outcome.
         
         Args:
-            num_workers: Number of worker threads
+            callback: Callback for the task's outcome, or None
+            future: Finished task future
         """
-        self.workers = []
-        self.task_count = 0
-        self.task_map = {}
-        
-        # Create workers
-        for i in range(num_workers):
-            worker = ThreadWorker(f"Worker-{i+1}")
-            worker.start()
-            self.workers.append(worker)
+        with self._pending_lock:
+            self._pending.pop(future, None)
+        _task_done(callback, future)
     
     def add_task(
         self,
@@ -153,88 +130,56 @@ class TaskPool:
         *args,
         callback: Optional[Callable[[bool, Any], None]] = None,
         **kwargs
-    ) -> str:
+    ) -> Future:
         """
         Add a task to the pool.
         
         Args:
             func: Function to execute
             *args: Function arguments
-            callback: Optional callback function
+            callback: Optional callback taking (success, result or
+                exception), called from the worker thread when the task finishes
             **kwargs: Function keyword arguments
             
         Returns:
-            Task ID
+            Future that receives the task's result or exception
         """
-        # Generate task ID
-        task_id = f"task-{self.task_count}"
-        self.task_count += 1
-        
-        # Select worker (round-robin)
-        worker_idx = (self.task_count - 1) % len(self.workers)
-        worker = self.workers[worker_idx]
-        
-        # Add task to worker
-        worker.add_task(task_id, func, *args, **kwargs)
-        
-        # Store callback if provided
-        if callback:
-            self.task_map[task_id] = (worker, callback)
-            
-            # Start result checker if needed
-            if len(self.task_map) == 1:
-                threading.Thread(target=self._check_results, daemon=True).start()
+        future = self._executor.submit(func, *args, **kwargs)
+        self._track([(future, callback)])
         
-        return task_id
+        return future
     
-    def get_result(self, task_id: str) -> Tuple[bool, Any]:
+    def add_tasks(
+        self,
+        specs: Iterable[Tuple[Callable, tuple, Dict[str, Any], Optional[Callable[[bool, Any], None]]]]
+    ) -> List[Future]:
         """
-        Get the result of a task.
+        Add several tasks to the pool at once.
+        
+        The batch is recorded with a single lock acquisition.
         
         Args:
-            task_id: Task identifier
+            specs: (func, args, kwargs, callback) for each task; callback may be None
             
         Returns:
-            Tuple of (success, result)
+            Futures of the tasks, in the same order
         """
-        if task_id not in self.task_map:
-            return False, None
-            
-        worker, _ = self.task_map[task_id]
-        return worker.get_result(task_id, remove=True)
-    
-    def _check_results(self):
-        """Check for completed tasks and call callbacks."""
-        while self.task_map:
-            # Copy task map to avoid modification during iteration
-            tasks = list(self.task_map.items())
-            
-            for task_id, (worker, callback) in tasks:
-                success, result = worker.get_result(task_id, remove=False)
-                
-                if success is not None:
-                    # Call callback
-                    try:
-                        callback(success, result)
-                    except Exception as e:
-                        error(f"Error in callback for task {task_id}", e)
-                    
-                    # Remove task
-                    del self.task_map[task_id]
-            
-            # Sleep briefly
-            time.sleep(0.1)
+        submit = self._executor.submit
+        submitted = [
+            (submit(func, *args, **kwargs), callback)
+            for func, args, kwargs, callback in specs
+        ]
+        self._track(submitted)
+        return [future for future, _ in submitted]
     
     def shutdown(self):
-        """Shutdown the task pool."""
-        for worker in self.workers:
-            worker.stop()
-        self.workers = []
-        self.task_map = {}
+        """Shutdown the task pool, dropping tasks that have not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
-# Global task pool
+# Global task pool (created and shut down under the lock)
 _global_pool = None
+_global_pool_lock = threading.Lock()
 
 
 def get_task_pool() -> TaskPool:
@@ -246,10 +191,14 @@ def get_task_pool() -> TaskPool:
     """
     global _global_pool
     
-    if _global_pool is None:
-        _global_pool = TaskPool()
+    pool = _global_pool
+    if pool is None:
+        with _global_pool_lock:
+            if _global_pool is None:
+                _global_pool = TaskPool()
+            pool = _global_pool
         
-    return _global_pool
+    return pool
 
 
 def run_in_thread(
@@ -257,7 +206,7 @@ def run_in_thread(
     *args,
     callback: Optional[Callable[[bool, Any], None]] = None,
     **kwargs
-) -> str:
+) -> Future:
     """
     Run a function in a separate thread.
     
@@ -268,7 +217,7 @@ def run_in_thread(
         **kwargs: Function keyword arguments
         
     Returns:
-        Task ID
+        Future that receives the function's result or exception
     """
     return get_task_pool().add_task(func, *args, callback=callback, **kwargs)
 
@@ -277,6 +226,7 @@ def shutdown_threads():
     """Shutdown all threads."""
     global _global_pool
     
-    if _global_pool is not None:
-        _global_pool.shutdown()
-        _global_pool = None
\ No newline at end of file
+    with _global_pool_lock:
+        if _global_pool is not None:
+            _global_pool.shutdown()
+            _global_pool = None
\ No newline at end of file
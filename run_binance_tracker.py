@@ -8,7 +8,6 @@ It ensures the proper Python path is set up for imports.
 
 import os
 import sys
-import importlib.util
 
 # Get the absolute path of the current script
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -17,12 +16,9 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-# Import the main module directly
-main_path = os.path.join(current_dir, "binance_tracker", "main.py")
-spec = importlib.util.spec_from_file_location("main_module", main_path)
-main_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(main_module)
+# Import the main module through the regular import system (uses the cached bytecode)
+from binance_tracker.main import main
 
 if __name__ == "__main__":
     # Run the main function from the imported module
-    main_module.main()
\ No newline at end of file
+    main()
\ No newline at end of file